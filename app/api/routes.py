@@ -1,6 +1,11 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
 import logging
+import pandas as pd
+from app.core.jobs import Job, JobStore
 from app.models.rule import Rule
 from app.rules.expectation_rules import get_all_expectation_rules
 from app.validators.validator import data_validator
@@ -10,6 +15,7 @@ from app.validators.validator_registry import get_validator
 from app.models.validation import (
     ValidationRequest, 
     ValidationResponse, 
+    ValidationJobResponse,
     ValidationRule,
     ValidationResultDetail, 
     ValidationSummary,
@@ -27,15 +33,125 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Results of /api/rules/validate/jobs, kept in process until evicted
+validation_jobs = JobStore()
+
+# The rule catalogue is static for the lifetime of the process, so validate and
+# encode it once instead of on every GET /api/rules
+_RULES_ADAPTER = TypeAdapter(list[Rule])
+_RULES_JSON = _RULES_ADAPTER.dump_json(_RULES_ADAPTER.validate_python(get_all_expectation_rules()))
+
 @router.get("/api/rules", response_model=list[Rule])
-def read_all_rules():
-    return get_all_expectation_rules()
+async def read_all_rules():
+    return Response(content=_RULES_JSON, media_type="application/json")
 
 @router.post("/api/rules/validate", response_model=ValidationResponse)
-def validate_data(request: ValidationRequest) -> ValidationResponse:
+async def validate_data(request: ValidationRequest) -> ValidationResponse:
     """
     Validate data using specified rules
     
+    Args:
+        request: ValidationRequest containing dataset and rules
+        
+    Returns:
+        ValidationResponse with validation results
+    """
+    # Rule evaluation is CPU-bound, keep it off the event loop
+    return await run_in_threadpool(process_validation_request, request)
+
+
+def _job_response(job: Job) -> ValidationJobResponse:
+    return ValidationJobResponse(
+        job_id=job.job_id,
+        status=job.status,
+        status_url=f"/api/rules/validate/jobs/{job.job_id}",
+        result=job.result,
+        error=job.error
+    )
+
+
+def _run_validation_job(job_id: str, request: ValidationRequest) -> None:
+    """Background task body; runs in the threadpool after the 202 is sent"""
+    validation_jobs.mark_processing(job_id)
+    try:
+        validation_jobs.complete(job_id, process_validation_request(request))
+    except HTTPException as e:
+        validation_jobs.fail(job_id, str(e.detail))
+    except Exception as e:
+        logger.error("Validation job %s failed: %s", job_id, e)
+        validation_jobs.fail(job_id, f"Validation failed: {str(e)}")
+
+
+@router.post("/api/rules/validate/jobs", status_code=202, response_model=ValidationJobResponse)
+async def submit_validation_job(request: ValidationRequest, background_tasks: BackgroundTasks) -> ValidationJobResponse:
+    """
+    Queue a validation request and return immediately
+    
+    Large datasets would otherwise hold a worker for the whole run; poll the
+    returned status_url for the result.
+    
+    Args:
+        request: ValidationRequest containing dataset and rules
+        background_tasks: FastAPI background task queue
+        
+    Returns:
+        ValidationJobResponse with the pending job
+    """
+    # Reject obviously invalid requests up front rather than as failed jobs
+    if not request.dataset:
+        raise HTTPException(status_code=400, detail="Dataset is required")
+    if not request.rules:
+        raise HTTPException(status_code=400, detail="Rules are required")
+    
+    job = validation_jobs.create()
+    background_tasks.add_task(_run_validation_job, job.job_id, request)
+    
+    return _job_response(job)
+
+
+@router.get("/api/rules/validate/jobs/{job_id}", response_model=ValidationJobResponse)
+async def get_validation_job(job_id: str) -> ValidationJobResponse:
+    """
+    Get the status, and once finished the result, of a validation job
+    
+    Args:
+        job_id: Identifier returned when the job was submitted
+        
+    Returns:
+        ValidationJobResponse with the current job state
+    """
+    job = validation_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Validation job not found")
+    
+    return _job_response(job)
+
+
+@dataclass(slots=True)
+class _RuleTally:
+    """Per-request pass/fail counters, folded into ValidationSummary once at the end"""
+    successful: int = 0
+    failed: int = 0
+
+
+def _validation_error_result(rule: ValidationRule, error: Exception) -> ValidationResultDetail:
+    """Build the failed result reported for a rule that raised during validation"""
+    logger.error("Error validating rule %s: %s", rule.rule_name, error)
+    return ValidationResultDetail.model_construct(
+        rule_name=rule.rule_name,
+        column_name=rule.column_name or "",
+        success=False,
+        message=f"Validation error: {str(error)}",
+        details={}
+    )
+
+
+def process_validation_request(request: ValidationRequest) -> ValidationResponse:
+    """
+    Run every rule in the request against its dataset synchronously
+    
+    Shared by the HTTP endpoint and the SQS message processor.
+    
     Args:
         request: ValidationRequest containing dataset and rules
         
@@ -51,75 +167,72 @@ def validate_data(request: ValidationRequest) -> ValidationResponse:
         if not rules:
             raise HTTPException(status_code=400, detail="Rules are required")
         
-        # Process validation using existing validator
-        results = []
-        summary_data = {
-            "total_rules": len(rules), 
-            "successful_rules": 0, 
-            "failed_rules": 0,
-            "success_rate": 0.0,
-            "total_rows": len(data),
-            "total_columns": len(data[0].keys()) if data and len(data) > 0 else 0,
-            "execution_time_ms": 0
-        }
+        # Loop invariants, bound once
+        total_rules = len(rules)
+        n_rows = len(data)
+        n_cols = len(data[0])
+        tally = _RuleTally()
+        
+        # Every validator starts with pd.DataFrame(data); transpose the rows into
+        # columns once here so each rule only wraps an existing frame
+        try:
+            frame = pd.DataFrame(data)
+        except Exception:
+            # Let each validator report the conversion error for its own rule
+            frame = data
         
+        results: List[ValidationResultDetail] = []
         for rule in rules:
             try:
                 rule_name = rule.rule_name
                 column_name = rule.column_name
-                value = rule.value or {}
                 
                 # Get validator function from registry
                 validator_func = get_validator(rule_name)
                 
                 # Call validator function directly
-                result = validator_func(data, rule)
+                result = validator_func(frame, rule)
+                
+                # Validators may hand back numpy booleans; results are built
+                # without validation, so normalise the types here
+                success = bool(result.get("success", False))
                 
-                results.append(ValidationResultDetail(
+                results.append(ValidationResultDetail.model_construct(
                     rule_name=rule_name,
                     column_name=column_name,
-                    success=result.get("success", False),
-                    message=result.get("message", "") or result.get("error", "") or f"Validation result for {rule_name}",
-                    details=result.get("details", {}),
-                    # Legacy compatibility
-                    rule=rule_name,
-                    column=column_name
+                    success=success,
+                    message=str(result.get("message") or result.get("error") or f"Validation result for {rule_name}"),
+                    details=result.get("details") or {}
                 ))
                 
-                if result.get("success", False):
-                    summary_data["successful_rules"] += 1
+                if success:
+                    tally.successful += 1
                 else:
-                    summary_data["failed_rules"] += 1
+                    tally.failed += 1
                     
             except Exception as e:
-                logger.error(f"Error validating rule {rule.rule_name}: {e}")
-                results.append(ValidationResultDetail(
-                    rule_name=rule.rule_name,
-                    column_name=rule.column_name or "",
-                    success=False,
-                    message=f"Validation error: {str(e)}",
-                    details={},
-                    # Legacy compatibility
-                    rule=rule.rule_name,
-                    column=rule.column_name or ""
-                ))
-                summary_data["failed_rules"] += 1
-        
-        # Calculate success rate
-        summary_data["success_rate"] = (
-            summary_data["successful_rules"] / summary_data["total_rules"] 
-            if summary_data["total_rules"] > 0 else 0.0
-        )
+                results.append(_validation_error_result(rule, e))
+                tally.failed += 1
         
-        return ValidationResponse(
+        # Everything below is produced by this function from validated input,
+        # so skip re-validating it; FastAPI still checks the response_model
+        return ValidationResponse.model_construct(
             results=results,
-            summary=ValidationSummary(**summary_data)
+            summary=ValidationSummary.model_construct(
+                total_rules=total_rules,
+                successful_rules=tally.successful,
+                failed_rules=tally.failed,
+                success_rate=tally.successful / total_rules,
+                total_rows=n_rows,
+                total_columns=n_cols,
+                execution_time_ms=0
+            )
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Validation request failed: {e}")
+        logger.error("Validation request failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Validation failed: {str(e)}")
 
 # SQS Routes - temporarily disabled during format update
@@ -134,249 +247,5 @@ SQS_AVAILABLE = False
 
 # SQS Management Routes
 if SQS_AVAILABLE:
-    @router.get("/sqs/status")
-    async def get_sqs_status() -> Dict[str, Any]:
-        """
-        Get SQS manager status and statistics
-        
-        Returns:
-            SQS manager status including worker stats and queue information
-        """
-        try:
-            manager = get_sqs_manager()
-            return manager.get_status()
-        except Exception as e:
-            logger.error(f"Failed to get SQS status: {e}")
-            raise HTTPException(status_code=500, detail="Failed to get SQS status")
-
-    @router.get("/sqs/health")
-    async def get_sqs_health() -> Dict[str, Any]:
-        """
-        Get SQS health check information
-        
-        Returns:
-            Health status of SQS connection, queues, and workers
-        """
-        try:
-            manager = get_sqs_manager()
-            return manager.get_health()
-        except Exception as e:
-            logger.error(f"Failed to get SQS health: {e}")
-            raise HTTPException(status_code=500, detail="Failed to get SQS health")
-
-    @router.post("/sqs/start")
-    async def start_sqs(background_tasks: BackgroundTasks):
-        """
-        Start SQS processing workers
-        
-        Returns:
-            Success message
-        """
-        try:
-            manager = get_sqs_manager()
-            if manager.is_running:
-                raise HTTPException(status_code=400, detail="SQS processing is already running")
-            
-            # Start SQS processing in background
-            background_tasks.add_task(start_sqs_processing)
-            
-            return {"message": "SQS processing started successfully"}
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to start SQS processing: {e}")
-            raise HTTPException(status_code=500, detail="Failed to start SQS processing")
-
-    @router.post("/sqs/stop")
-    async def stop_sqs():
-        """
-        Stop SQS processing workers
-        
-        Returns:
-            Success message
-        """
-        try:
-            manager = get_sqs_manager()
-            if not manager.is_running:
-                raise HTTPException(status_code=400, detail="SQS processing is not running")
-            
-            await stop_sqs_processing()
-            
-            return {"message": "SQS processing stopped successfully"}
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to stop SQS processing: {e}")
-            raise HTTPException(status_code=500, detail="Failed to stop SQS processing")
-
-    @router.get("/sqs/queue-stats")
-    async def get_queue_stats() -> Dict[str, Any]:
-        """
-        Get queue statistics for all configured queues
-        
-        Returns:
-            Queue statistics including message counts
-        """
-        try:
-            manager = get_sqs_manager()
-            return manager.sqs_client.get_queue_stats()
-        except Exception as e:
-            logger.error(f"Failed to get queue stats: {e}")
-            raise HTTPException(status_code=500, detail="Failed to get queue statistics")
-
-    @router.post("/sqs/send-message")
-    async def send_validation_message(
-        validation_request: SQSValidationRequest,
-        queue_url: Optional[str] = None
-    ):
-        """
-        Send a validation message to SQS queue
-        
-        Args:
-            validation_request: Validation request to send
-            queue_url: Optional queue URL (defaults to input queue)
-            
-        Returns:
-            Message ID if successful
-        """
-        try:
-            manager = get_sqs_manager()
-            
-            message_id = manager.sqs_client.send_message(
-                validation_request.dict(),
-                queue_url=queue_url
-            )
-            
-            if not message_id:
-                raise HTTPException(status_code=500, detail="Failed to send message")
-            
-            return {
-                "message": "Validation message sent successfully",
-                "message_id": message_id,
-                "queue": queue_url or manager.settings.input_queue_url,
-                "request_id": validation_request.message_id
-            }
-            
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to send validation message: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to send message: {str(e)}")
-
-    @router.post("/sqs/send-test-message")
-    async def send_test_message(
-        queue_url: Optional[str] = None
-    ):
-        """
-        Send a test validation message to SQS queue for testing purposes
-        
-        Args:
-            queue_url: Optional queue URL (defaults to input queue)
-            
-        Returns:
-            Message ID and details if successful
-        """
-        try:
-            from datetime import datetime
-            from app.models.sqs_models import DataEntry, ValidationRule
-            
-            # Create a test message
-            test_data_entry = DataEntry(
-                data_type="tabular",
-                data_key=f"test-dataset-{int(datetime.now().timestamp())}",
-                columns=["name", "age", "email", "salary"],
-                data=[
-                    {"name": "John Doe", "age": 25, "email": "john@example.com", "salary": 50000},
-                    {"name": "Jane Smith", "age": 30, "email": "jane@example.com", "salary": 75000},
-                    {"name": "Bob Johnson", "age": 35, "email": "bob@example.com", "salary": 60000},
-                    {"name": "Alice Brown", "age": 28, "email": "alice@example.com", "salary": 55000}
-                ],
-                source="fastapi_test",
-                schema_version="1.0"
-            )
-            
-            test_rules = [
-                ValidationRule(
-                    rule_name="expect_column_to_exist",
-                    column_name="name",
-                    rule_description="Ensure name column exists",
-                    severity="error"
-                ),
-                ValidationRule(
-                    rule_name="expect_column_values_to_be_between",
-                    column_name="age",
-                    value={"min_value": 18, "max_value": 65},
-                    rule_description="Age should be between 18 and 65",
-                    severity="error"
-                ),
-                ValidationRule(
-                    rule_name="expect_column_values_to_be_between",
-                    column_name="salary",
-                    value={"min_value": 30000, "max_value": 100000},
-                    rule_description="Salary should be between 30K and 100K",
-                    severity="warning"
-                )
-            ]
-            
-            test_request = SQSValidationRequest(
-                message_id=f"api-test-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
-                correlation_id=f"api-corr-{datetime.now().timestamp()}",
-                timestamp=datetime.now().isoformat(),
-                source="fastapi_api",
-                data_entry=test_data_entry,
-                validation_rules=test_rules,
-                batch_id=f"api-batch-{datetime.now().strftime('%Y%m%d')}",
-                priority=5,
-                max_retries=3
-            )
-            
-            manager = get_sqs_manager()
-            
-            message_id = manager.sqs_client.send_message(
-                test_request.dict(),
-                queue_url=queue_url
-            )
-            
-            if not message_id:
-                raise HTTPException(status_code=500, detail="Failed to send test message")
-            
-            return {
-                "message": "Test validation message sent successfully",
-                "message_id": message_id,
-                "queue": queue_url or manager.settings.input_queue_url,
-                "test_request_id": test_request.message_id,
-                "data_rows": len(test_data_entry.data),
-                "validation_rules": len(test_rules)
-            }
-            
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to send test message: {e}")
-            raise HTTPException(status_code=500, detail=f"Failed to send test message: {str(e)}")
-
-    @router.get("/sqs/worker-stats")
-    async def get_worker_stats() -> Dict[str, Any]:
-        """
-        Get detailed worker statistics
-        
-        Returns:
-            Individual worker performance statistics
-        """
-        try:
-            manager = get_sqs_manager()
-            status = manager.get_status()
-            
-            return {
-                "total_workers": status.get("worker_count", 0),
-                "running_workers": sum(1 for w in status.get("workers", []) if w.get("is_running", False)),
-                "total_processed": status.get("total_processed", 0),
-                "total_errors": status.get("total_errors", 0),
-                "success_rate": status.get("success_rate", 0),
-                "workers": status.get("workers", [])
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to get worker stats: {e}")
-            raise HTTPException(status_code=500, detail="Failed to get worker statistics")
-
+    from .sqs_routes import sqs_router
+    router.include_router(sqs_router)
@@ -0,0 +1,279 @@
+"""
+SQS management API routes.
+
+Registered on the main router by app.api.routes when SQS support is enabled.
+"""
+from fastapi import APIRouter, HTTPException, Depends
+from botocore.exceptions import BotoCoreError, ClientError
+from collections import Counter
+from typing import Dict, Any, Optional
+from datetime import datetime
+from functools import lru_cache
+import logging
+
+from ..core.cache import ttl_cache
+from ..core.sampling import TokenBucket
+from ..models.sqs_models import SQSValidationRequest
+from ..sqs import SQSManager, SQSClient, MessageBatcher, get_sqs_manager, schedule_sqs_processing, stop_sqs_processing
+
+logger = logging.getLogger(__name__)
+
+sqs_router = APIRouter()
+
+# Status endpoints are polled by dashboards; a short TTL collapses the fan-out
+# to the manager and the SQS API
+SQS_STATUS_CACHE_TTL_SECONDS = 2.0
+
+# Failures talking to SQS; anything else is a bug and goes to the default 500 handler
+SQS_ERRORS = (ClientError, BotoCoreError)
+
+# Every SQS failure is counted per operation, but during an outage only a
+# burst of 10 and then one record per second reach the log
+sqs_route_errors: Counter = Counter()
+_error_log_bucket = TokenBucket(rate=1.0, capacity=10)
+
+def _log_sqs_error(message: str, error: Exception) -> None:
+    """Record an SQS failure and log it if the sampling budget allows"""
+    sqs_route_errors[message] += 1
+    if _error_log_bucket.consume():
+        logger.error("%s: %s", message, error)
+
+
+@lru_cache(maxsize=1)
+def _manager() -> SQSManager:
+    """Resolve the process-wide SQS manager once and inject it into every handler"""
+    return get_sqs_manager()
+
+@lru_cache(maxsize=32)
+def _batcher(sqs_client: SQSClient, queue_url: Optional[str]) -> MessageBatcher:
+    """Shared send buffer per client and target queue, so concurrent sends coalesce"""
+    return MessageBatcher(sqs_client, queue_url)
+
+# Static part of the /sqs/send-test-message payload, in the DataEntry input format
+_TEST_MESSAGE_ENTRY = {
+    "data_type": "tabular",
+    "domain_name": "fastapi_test",
+    "data": {"id": "test-record-1", "name": "John Doe", "age": 25, "email": "john@example.com", "salary": 50000},
+    "validation_rules": [
+        {
+            "rule_name": "expect_column_to_exist",
+            "column_name": "name",
+            "rule_description": "Ensure name column exists",
+            "severity": "error"
+        },
+        {
+            "rule_name": "expect_column_values_to_be_between",
+            "column_name": "age",
+            "value": {"min_value": 18, "max_value": 65},
+            "rule_description": "Age should be between 18 and 65",
+            "severity": "error"
+        },
+        {
+            "rule_name": "expect_column_values_to_be_between",
+            "column_name": "salary",
+            "value": {"min_value": 30000, "max_value": 100000},
+            "rule_description": "Salary should be between 30K and 100K",
+            "severity": "warning"
+        }
+    ]
+}
+
+
+def _invalidate_sqs_status_cache() -> None:
+    """Drop cached status snapshots after the worker state changes"""
+    for handler in (get_sqs_status, get_sqs_health, get_queue_stats, get_worker_stats):
+        handler.cache_clear()
+
+@sqs_router.get("/sqs/status")
+@ttl_cache(SQS_STATUS_CACHE_TTL_SECONDS)
+async def get_sqs_status(manager: SQSManager = Depends(_manager)) -> Dict[str, Any]:
+    """
+    Get SQS manager status and statistics
+
+    Returns:
+        SQS manager status including worker stats and queue information,
+        plus the per-operation SQS failure counts and how many of those
+        failures were left out of the log by sampling
+    """
+    try:
+        return {
+            **manager.get_status(),
+            "route_errors": dict(sqs_route_errors),
+            "suppressed_error_logs": _error_log_bucket.dropped
+        }
+    except SQS_ERRORS as e:
+        _log_sqs_error("Failed to get SQS status", e)
+        raise HTTPException(status_code=500, detail="Failed to get SQS status")
+
+@sqs_router.get("/sqs/health")
+@ttl_cache(SQS_STATUS_CACHE_TTL_SECONDS)
+async def get_sqs_health(manager: SQSManager = Depends(_manager)) -> Dict[str, Any]:
+    """
+    Get SQS health check information
+
+    Returns:
+        Health status of SQS connection, queues, and workers
+    """
+    try:
+        return manager.get_health()
+    except SQS_ERRORS as e:
+        _log_sqs_error("Failed to get SQS health", e)
+        raise HTTPException(status_code=500, detail="Failed to get SQS health")
+
+@sqs_router.post("/sqs/start")
+async def start_sqs(manager: SQSManager = Depends(_manager)):
+    """
+    Start SQS processing workers
+
+    Returns:
+        Success message
+    """
+    if manager.is_running:
+        raise HTTPException(status_code=400, detail="SQS processing is already running")
+
+    # Start SQS processing as a tracked task so shutdown can cancel it; SQS
+    # failures surface in that task, not here
+    task = schedule_sqs_processing()
+    task.add_done_callback(lambda _: _invalidate_sqs_status_cache())
+
+    return {"message": "SQS processing started successfully"}
+
+@sqs_router.post("/sqs/stop")
+async def stop_sqs(manager: SQSManager = Depends(_manager)):
+    """
+    Stop SQS processing workers
+
+    Returns:
+        Success message
+    """
+    try:
+        if not manager.is_running:
+            raise HTTPException(status_code=400, detail="SQS processing is not running")
+
+        await stop_sqs_processing()
+        _invalidate_sqs_status_cache()
+
+        return {"message": "SQS processing stopped successfully"}
+    except SQS_ERRORS as e:
+        _log_sqs_error("Failed to stop SQS processing", e)
+        raise HTTPException(status_code=500, detail="Failed to stop SQS processing")
+
+@sqs_router.get("/sqs/queue-stats")
+@ttl_cache(SQS_STATUS_CACHE_TTL_SECONDS)
+async def get_queue_stats(manager: SQSManager = Depends(_manager)) -> Dict[str, Any]:
+    """
+    Get queue statistics for all configured queues
+
+    Returns:
+        Queue statistics including message counts
+    """
+    try:
+        return manager.sqs_client.get_queue_stats()
+    except SQS_ERRORS as e:
+        _log_sqs_error("Failed to get queue stats", e)
+        raise HTTPException(status_code=500, detail="Failed to get queue statistics")
+
+@sqs_router.post("/sqs/send-message")
+async def send_validation_message(
+    validation_request: SQSValidationRequest,
+    queue_url: Optional[str] = None,
+    manager: SQSManager = Depends(_manager)
+):
+    """
+    Send a validation message to SQS queue
+
+    Args:
+        validation_request: Validation request to send
+        queue_url: Optional queue URL (defaults to input queue)
+
+    Returns:
+        Message ID if successful
+    """
+    try:
+        # Serialize straight to the JSON body in one pass; the batch send forwards it as-is
+        message_id = await _batcher(manager.sqs_client, queue_url).send(
+            validation_request.model_dump_json(exclude_none=True)
+        )
+
+        if not message_id:
+            raise HTTPException(status_code=500, detail="Failed to send message")
+
+        return {
+            "message": "Validation message sent successfully",
+            "message_id": message_id,
+            "queue": queue_url or manager.settings.input_queue_url,
+            "request_id": validation_request.data_entry.file_id
+        }
+
+    except SQS_ERRORS as e:
+        _log_sqs_error("Failed to send validation message", e)
+        raise HTTPException(status_code=500, detail=f"Failed to send message: {str(e)}")
+
+@sqs_router.post("/sqs/send-test-message")
+async def send_test_message(
+    queue_url: Optional[str] = None,
+    manager: SQSManager = Depends(_manager)
+):
+    """
+    Send a test validation message to SQS queue for testing purposes
+
+    Args:
+        queue_url: Optional queue URL (defaults to input queue)
+
+    Returns:
+        Message ID and details if successful
+    """
+    try:
+        # Only the identifiers vary per call; the record and rules are shared
+        now = datetime.now()
+        test_request = {
+            "data_entry": {
+                **_TEST_MESSAGE_ENTRY,
+                "file_id": f"api-test-{now:%Y%m%d-%H%M%S-%f}",
+                "policy_id": f"api-test-policy-{now:%Y%m%d}",
+            }
+        }
+
+        message_id = await _batcher(manager.sqs_client, queue_url).send(test_request)
+
+        if not message_id:
+            raise HTTPException(status_code=500, detail="Failed to send test message")
+
+        return {
+            "message": "Test validation message sent successfully",
+            "message_id": message_id,
+            "queue": queue_url or manager.settings.input_queue_url,
+            "test_request_id": test_request["data_entry"]["file_id"],
+            "data_rows": 1,
+            "validation_rules": len(_TEST_MESSAGE_ENTRY["validation_rules"])
+        }
+
+    except SQS_ERRORS as e:
+        _log_sqs_error("Failed to send test message", e)
+        raise HTTPException(status_code=500, detail=f"Failed to send test message: {str(e)}")
+
+@sqs_router.get("/sqs/worker-stats")
+@ttl_cache(SQS_STATUS_CACHE_TTL_SECONDS)
+async def get_worker_stats(manager: SQSManager = Depends(_manager)) -> Dict[str, Any]:
+    """
+    Get detailed worker statistics
+
+    Returns:
+        Individual worker performance statistics
+    """
+    try:
+        # Share the cached /sqs/status snapshot instead of recomputing it
+        status = await get_sqs_status(manager=manager)
+
+        return {
+            "total_workers": status.get("worker_count", 0),
+            "running_workers": status.get("active_workers", 0),
+            "total_processed": status.get("total_processed", 0),
+            "total_errors": status.get("total_errors", 0),
+            "success_rate": status.get("success_rate", 0),
+            "workers": status.get("workers") or []
+        }
+
+    except SQS_ERRORS as e:
+        _log_sqs_error("Failed to get worker stats", e)
+        raise HTTPException(status_code=500, detail="Failed to get worker statistics")
@@ -0,0 +1,42 @@
+"""
+Small in-process caching helpers for API handlers.
+"""
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+def ttl_cache(ttl_seconds: float) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Cache the result of an async function for a fixed number of seconds.
+
+    Results are keyed by call arguments. Exceptions are never cached, so a
+    failing call is retried on the next request. The wrapped function exposes
+    cache_clear() for explicit invalidation.
+
+    Args:
+        ttl_seconds: How long a cached result stays valid
+
+    Returns:
+        Decorator for async functions
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            entry = entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            value = await func(*args, **kwargs)
+            entries[key] = (now + ttl_seconds, value)
+            return value
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
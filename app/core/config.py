@@ -2,9 +2,12 @@ from pydantic_settings import BaseSettings
 from pydantic import ConfigDict, field_validator
 from typing import List, Union
 import json
+import logging
 import os
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 def get_env_file_path() -> str:
     """
     Determine which .env file to use based on APP_ENV environment variable.
@@ -37,10 +40,9 @@ def get_env_file_path() -> str:
     if app_env in env_mapping:
         env_file = project_root / env_mapping[app_env]
         if env_file.exists():
-            print(f"🌍 Using environment file: {env_file.name} (APP_ENV={app_env})")
             return str(env_file)
         else:
-            print(f"⚠️ Environment file {env_file.name} not found for APP_ENV={app_env}")
+            logger.warning("⚠️ Environment file %s not found for APP_ENV=%s", env_file.name, app_env)
     
     # Fallback logic - only use .env if no specific environment was requested
     if not app_env:  # Only fallback to .env if APP_ENV is not set
@@ -51,18 +53,27 @@ def get_env_file_path() -> str:
     for fallback in fallback_files:
         fallback_path = project_root / fallback
         if fallback_path.exists():
-            print(f"🔄 Falling back to: {fallback_path.name}")
             return str(fallback_path)
     
     # If no env files exist, return default path
+    # Resolution runs at import, before logging is configured, so only the
+    # unexpected cases are logged here (warnings still reach stderr); the
+    # resolved path is logged at application startup
     default_path = project_root / ".env"
-    print(f"📝 No environment files found, using default: {default_path.name}")
+    logger.warning("⚠️ No environment files found, using default: %s", default_path.name)
     return str(default_path)
 
+# Resolved once at import; Settings() instances reuse it instead of re-probing the filesystem
+ENV_FILE_PATH = get_env_file_path()
+
 class Settings(BaseSettings):
     # Server Configuration
     host: str = "0.0.0.0"
     port: int = 8008
+    # uvicorn worker processes. Background validation jobs, SQS consumers and
+    # the /sqs control endpoints all live in one process, so more than one
+    # worker is opt-in and needs sticky routing for /api/rules/validate/jobs.
+    workers: int = 1
     
     # Environment
     environment: str = "development"
@@ -98,11 +109,12 @@ class Settings(BaseSettings):
         return v
 
     model_config = ConfigDict(
-        env_file=get_env_file_path(),
+        env_file=ENV_FILE_PATH,
         env_file_encoding='utf-8',
         case_sensitive=False,
         extra="ignore",  # Ignore extra fields from .env file
-        env_prefix=""  # Don't use any prefix for environment variables
+        env_prefix="",  # Don't use any prefix for environment variables
+        frozen=True  # Loaded once at startup; reject accidental runtime mutation
     )
 
 settings = Settings()
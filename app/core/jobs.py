@@ -0,0 +1,65 @@
+"""
+In-memory store for background jobs run by the API process.
+"""
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from app.models.validation import MessageStatus
+
+
+@dataclass(slots=True)
+class Job:
+    """State of a single background job"""
+    job_id: str
+    status: MessageStatus = MessageStatus.PENDING
+    result: Any = None
+    error: Optional[str] = None
+
+
+class JobStore:
+    """
+    Thread-safe, bounded registry of background jobs.
+
+    Jobs are updated from threadpool workers and read from request handlers.
+    Once max_jobs is reached the oldest jobs are evicted, so results must be
+    collected by polling within a reasonable time.
+    """
+
+    def __init__(self, max_jobs: int = 1000):
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self) -> Job:
+        """Register a new pending job"""
+        job = Job(job_id=str(uuid.uuid4()))
+        with self._lock:
+            self._jobs[job.job_id] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return the job, or None if it is unknown or was evicted"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def mark_processing(self, job_id: str) -> None:
+        self._update(job_id, status=MessageStatus.PROCESSING)
+
+    def complete(self, job_id: str, result: Any) -> None:
+        self._update(job_id, status=MessageStatus.SUCCESS, result=result)
+
+    def fail(self, job_id: str, error: str) -> None:
+        self._update(job_id, status=MessageStatus.FAILED, error=error)
+
+    def _update(self, job_id: str, **changes: Any) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            for name, value in changes.items():
+                setattr(job, name, value)
@@ -0,0 +1,52 @@
+"""
+ASGI middleware shared by the API application.
+"""
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class AccessLogMiddleware:
+    """
+    Log each HTTP request and its response status and duration.
+
+    Implemented as plain ASGI rather than @app.middleware("http"), which wraps
+    every request in BaseHTTPMiddleware's extra task and memory streams.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Nothing below is emitted above INFO, so skip the bookkeeping entirely
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        if query_string := scope.get("query_string"):
+            path = f"{path}?{query_string.decode('latin-1')}"
+
+        # Log the request
+        logger.info("🔍 %s %s", method, path)
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                logger.info("🌐 Origin: %s", value.decode("latin-1"))
+                break
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_with_status)
+
+        # Log the response
+        process_time = time.perf_counter() - start_time
+        logger.info("✅ %s %s - %s - %.2fs", method, path, status_code, process_time)
@@ -0,0 +1,34 @@
+"""
+Rate limiting helpers for sampling noisy, repeated events such as error logs.
+"""
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket allowing short bursts of events, then a steady rate.
+
+    Starts full with `capacity` tokens and refills at `rate` tokens per
+    second. consume() never blocks; callers simply skip the event when it
+    returns False. Calls that were refused are counted in `dropped`.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.dropped = 0
+        self._updated = time.monotonic()
+
+    def consume(self) -> bool:
+        """Take one token if available"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+
+        self.dropped += 1
+        return False
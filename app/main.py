@@ -1,11 +1,12 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
-import time
 import logging
+from contextlib import asynccontextmanager
 from app.api.routes import router
-from app.core.config import settings
+from app.core.config import ENV_FILE_PATH, settings
+from app.core.middleware import AccessLogMiddleware
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -13,78 +14,23 @@ logger = logging.getLogger(__name__)
 
 # Conditional import for SQS functionality
 try:
-    from app.sqs import start_sqs_processing, stop_sqs_processing, get_sqs_manager
+    from app.sqs import schedule_sqs_processing, cancel_sqs_processing_task, stop_sqs_processing, get_sqs_manager
+    # Module-level instance, so the SQS env file is parsed once per process
+    from app.sqs.config import sqs_settings
     SQS_AVAILABLE = True
     logger.info("✅ SQS functionality available")
 except ImportError as e:
-    logger.warning(f"⚠️ SQS functionality not available: {e}")
+    logger.warning("⚠️ SQS functionality not available: %s", e)
     SQS_AVAILABLE = False
 
-app = FastAPI(
-    title=settings.api_title,
-    version=settings.api_version,
-    description=settings.api_description
-)
-
-# Add CORS middleware - this must be added before other middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins,
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD", "PATCH"],
-    allow_headers=["*"],
-    expose_headers=["*"]
-)
-
-# Add request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-    
-    # Log the request
-    logger.info(f"🔍 {request.method} {request.url}")
-    if origin := request.headers.get("origin"):
-        logger.info(f"🌐 Origin: {origin}")
-    
-    response = await call_next(request)
-    
-    # Log the response
-    process_time = time.time() - start_time
-    logger.info(f"✅ {request.method} {request.url} - {response.status_code} - {process_time:.2f}s")
-    
-    return response
-
-# Add health check endpoint
-@app.get("/health")
-async def health_check():
-    """Health check endpoint to verify the service is running"""
-    return {
-        "status": "healthy",
-        "service": settings.api_title,
-        "version": settings.api_version,
-        "environment": settings.environment,
-        "cors_enabled": True,
-        "allowed_origins": settings.allowed_origins
-    }
-
-app.include_router(router)
-
-# Global variable to track SQS task
-_sqs_task = None
-
-# Add startup and shutdown events for SQS
-@app.on_event("startup")
-async def startup_event():
-    """Application startup event"""
-    global _sqs_task
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start SQS processing on startup and tear it down on shutdown"""
     logger.info("🚀 Application starting up...")
+    logger.info("🌍 Using environment file: %s", ENV_FILE_PATH)
     
     if SQS_AVAILABLE:
         try:
-            # Check if SQS is configured and user wants auto-start
-            from app.sqs.config import SQSSettings
-            sqs_settings = SQSSettings()
-            
             # Print the SQS queue URLs for debugging
             print(f"🔗 SQS Input Queue URL: {sqs_settings.input_queue_url}")
             print(f"🔗 SQS Output Queue URL: {sqs_settings.output_queue_url}")
@@ -92,46 +38,81 @@ async def startup_event():
             if sqs_settings.auto_start_workers:
                 logger.info("🔄 Auto-starting SQS workers...")
                 # Start SQS processing in background but track the task
-                import asyncio
-                _sqs_task = asyncio.create_task(start_sqs_processing())
+                schedule_sqs_processing()
             else:
                 logger.info("⏸️ SQS workers not auto-started (auto_start_workers=False)")
                 
         except Exception as e:
-            logger.error(f"❌ Failed to start SQS processing: {e}")
+            logger.error("❌ Failed to start SQS processing: %s", e)
     
     logger.info("✅ Application startup complete")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown event"""
-    global _sqs_task
+    
+    yield
+    
     logger.info("🛑 Application shutting down...")
     
     if SQS_AVAILABLE:
         try:
             # Cancel the SQS task first
-            import asyncio
-            if _sqs_task and not _sqs_task.done():
-                logger.info("🛑 Cancelling SQS task...")
-                _sqs_task.cancel()
-                try:
-                    await _sqs_task
-                except asyncio.CancelledError:
-                    logger.info("✅ SQS task cancelled")
+            await cancel_sqs_processing_task()
             
             # Stop SQS processing
             await stop_sqs_processing()
             logger.info("✅ SQS processing stopped")
         except Exception as e:
-            logger.error(f"❌ Error stopping SQS processing: {e}")
+            logger.error("❌ Error stopping SQS processing: %s", e)
     
     logger.info("✅ Application shutdown complete")
 
+app = FastAPI(
+    title=settings.api_title,
+    version=settings.api_version,
+    description=settings.api_description,
+    lifespan=lifespan
+)
+
+# A wildcard makes any listed origins redundant; collapsing to ["*"] lets
+# CORSMiddleware answer with a plain "*" instead of matching each request's
+# origin. Browsers reject credentials with a wildcard, so they are only
+# allowed for an explicit origin list.
+_cors_origins = list(dict.fromkeys(settings.allowed_origins))
+_cors_allow_all = "*" in _cors_origins
+if _cors_allow_all:
+    _cors_origins = ["*"]
+
+# Add CORS middleware - this must be added before other middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=_cors_origins,
+    allow_credentials=not _cors_allow_all,
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD", "PATCH"],
+    allow_headers=["*"],
+    expose_headers=["*"]
+)
+
+# Add request logging middleware
+app.add_middleware(AccessLogMiddleware)
+
+# Add health check endpoint
+@app.get("/health")
+async def health_check():
+    """Health check endpoint to verify the service is running"""
+    return {
+        "status": "healthy",
+        "service": settings.api_title,
+        "version": settings.api_version,
+        "environment": settings.environment,
+        "cors_enabled": True,
+        "allowed_origins": settings.allowed_origins
+    }
+
+app.include_router(router)
+
 if __name__ == "__main__":
     import uvicorn
     import signal
     import sys
+    from importlib.util import find_spec
     
     def signal_handler(sig, frame):
         """Handle Ctrl+C gracefully"""
@@ -152,6 +133,15 @@ if __name__ == "__main__":
     print(f"Docs: http://{settings.host}:{settings.port}/docs")
     print(f"Environment file: .env")
     print(f"CORS: ✅ Enabled ({len(settings.allowed_origins)} origins)")
+    
+    # uvloop and httptools ship with uvicorn[standard]; pin them explicitly when
+    # present and fall back to the pure-Python stack (e.g. on Windows)
+    event_loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http_impl = "httptools" if find_spec("httptools") else "h11"
+    
+    # One process unless WORKERS opts in; job and SQS control state are per process
+    workers = settings.workers
+    print(f"Server: loop={event_loop}, http={http_impl}, workers={workers}")
     print("=" * 60)
     
     uvicorn.run(
@@ -159,6 +149,9 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=False,  # Disable reload for better shutdown behavior
+        workers=workers,
+        loop=event_loop,
+        http=http_impl,
         log_level="info",
         access_log=True,
         use_colors=True
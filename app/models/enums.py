@@ -0,0 +1,29 @@
+"""
+Shared enums for the validation and SQS models.
+Defined once so every model module uses the same classes.
+"""
+from enum import Enum
+
+
+class DataType(str, Enum):
+    """Supported data types for validation"""
+    TABULAR = "tabular"         # Pandas DataFrame-like data
+    JSON = "json"               # JSON object data
+    CSV = "csv"                 # CSV format data
+    PARQUET = "parquet"         # Parquet format data
+    DATABASE = "database"       # Database query result
+
+class MessageStatus(str, Enum):
+    """Message processing status"""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    SUCCESS = "success"
+    FAILED = "failed"
+    RETRY = "retry"
+    DLQ = "dlq"
+
+class RuleSeverity(str, Enum):
+    """Validation rule severity levels"""
+    ERROR = "error"
+    WARNING = "warning"
+    INFO = "info"
@@ -2,38 +2,70 @@
 SQS Message models for validation requests and responses.
 Updated format to match the new input/output queue structure.
 """
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import List, Dict, Any, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, TypeAdapter, ValidationError, field_validator, model_validator
+from pydantic.dataclasses import dataclass
+from typing import Annotated, List, Dict, Any, Literal, Optional, Union, get_args
 from datetime import datetime, timezone
-from enum import Enum
-
-class MessageStatus(str, Enum):
-    """Message processing status"""
-    PENDING = "pending"
-    PROCESSING = "processing"
-    SUCCESS = "success"
-    FAILED = "failed"
-    RETRY = "retry"
-    DLQ = "dlq"
-
-class DataType(str, Enum):
-    """Supported data types for validation"""
-    TABULAR = "tabular"         # Pandas DataFrame-like data
-    JSON = "json"               # JSON object data
-    CSV = "csv"                 # CSV format data
-    PARQUET = "parquet"         # Parquet format data
-    DATABASE = "database"       # Database query result
-
-class ValidationRule(BaseModel):
+from functools import cached_property, partial
+import sys
+
+from .enums import DataType, MessageStatus
+
+# Timestamp default factory; a partial avoids a lambda frame per model build
+_utcnow = partial(datetime.now, timezone.utc)
+
+# Timestamps go over the wire as integer epoch milliseconds. Inbound ints are
+# already read as epoch seconds/ms by pydantic, so only the JSON side needs help
+EpochMsDatetime = Annotated[
+    datetime,
+    PlainSerializer(lambda v: int(v.timestamp() * 1000), return_type=int, when_used='json')
+]
+
+# Messages are validated once on ingress and never mutated afterwards.
+# cache_strings='all' (pydantic's default, pinned here) makes the JSON parser
+# hand back one shared str object for repeated short strings such as rule and
+# column names, so later dict lookups and == checks hit the identity fast path
+_MESSAGE_CONFIG = ConfigDict(extra='ignore', frozen=True, cache_strings='all')
+
+# Internal results keep enum fields as their plain string values. Inbound
+# models keep the enum members, which callers read via .value
+_RESULT_CONFIG = ConfigDict(_MESSAGE_CONFIG, use_enum_values=True)
+
+# Outbound models are only built by this service, so an unexpected keyword
+# is a bug on our side; reject it instead of silently dropping it
+_OUTBOUND_CONFIG = ConfigDict(_MESSAGE_CONFIG, extra='forbid')
+_OUTBOUND_RECORD_CONFIG = ConfigDict(extra='forbid')
+
+# Per-rule records are built many times per message, so they are slotted
+# pydantic dataclasses rather than BaseModels; frozen is set on the decorator
+_RECORD_CONFIG = ConfigDict(extra='ignore')
+
+# Allowed values of the plain-string outbound fields. pydantic-core validates
+# literals with a direct string lookup. DataTypeT is derived from DataType so
+# the two cannot drift apart
+DataTypeT = Literal[tuple(member.value for member in DataType)]
+ResultStatusT = Literal["success", "fail"]
+_DATA_TYPE_VALUES = frozenset(get_args(DataTypeT))
+_RESULT_STATUS_VALUES = frozenset(get_args(ResultStatusT))
+
+@dataclass(config=_RECORD_CONFIG, frozen=True, slots=True)
+class ValidationRule:
     """
     Enhanced validation rule model following Great Expectations format.
     Now includes additional metadata fields for better rule management.
     """
     rule_name: str = Field(..., description="Great Expectations rule name (e.g., 'expect_column_to_exist')")
     column_name: Optional[str] = Field(default=None, description="Target column name for validation")
-    value: Optional[Union[Dict[str, Any], List[Any], str, int, float, bool]] = Field(
+    # Deliberately Any: queue bodies are JSON, so the value is already a dict,
+    # list, str, number, bool or None, and a 6-way smart union re-checking
+    # (and copying) it for every rule is wasted work
+    value: Any = Field(
         default=None, 
-        description="Rule parameters (e.g., {'min_value': 18, 'max_value': 65} for range validation)"
+        description="Rule parameters (e.g., {'min_value': 18, 'max_value': 65} for range validation)",
+        json_schema_extra={"anyOf": [
+            {"type": "object"}, {"type": "array"}, {"type": "string"},
+            {"type": "number"}, {"type": "boolean"}, {"type": "null"}
+        ]}
     )
     
     @field_validator('column_name', mode='before')
@@ -41,14 +73,18 @@ class ValidationRule(BaseModel):
     def normalize_column_name(cls, v):
         """Convert single-item list to string for backward compatibility"""
         if isinstance(v, list) and len(v) == 1:
-            return v[0]
-        return v
+            v = v[0]
+        # Values reaching a Python validator bypass the parser's string cache;
+        # this callback already runs, so intern here at no extra dispatch cost
+        return sys.intern(v) if isinstance(v, str) else v
     
     # Enhanced metadata fields
     rule_description: Optional[str] = Field(default=None, description="Human-readable description of the rule")
     severity: str = Field(default="error", description="Rule severity: 'error', 'warning', 'info'")
-    expectation_type: Optional[str] = Field(default=None, description="Great Expectations expectation type (often same as rule_name)")
-    kwargs: Optional[Dict[str, Any]] = Field(default=None, description="Additional keyword arguments for the rule")
+    # validate_default runs the fill-in validators below even when the field is
+    # omitted, so the defaults are set without mutating the frozen instance
+    expectation_type: Optional[str] = Field(default=None, validate_default=True, description="Great Expectations expectation type (often same as rule_name)")
+    kwargs: Optional[Dict[str, Any]] = Field(default=None, validate_default=True, description="Additional keyword arguments for the rule")
     
     @field_validator('expectation_type', mode='before')
     @classmethod
@@ -67,91 +103,103 @@ class ValidationRule(BaseModel):
                 return info.data['value']
         return v
     
-    @model_validator(mode='after')
-    def set_defaults_after_validation(self):
-        """Set defaults after all fields are validated"""
-        if self.expectation_type is None:
-            self.expectation_type = self.rule_name
-        if self.kwargs is None and self.value is not None and isinstance(self.value, dict):
-            self.kwargs = self.value
-        return self
-
 class DataEntry(BaseModel):
     """
     Updated data entry model to match the new SQS input format.
     Contains data type, file/policy IDs, actual data, and validation rules.
     """
+    model_config = _MESSAGE_CONFIG
+
     data_type: DataType = Field(..., description="Type of data being validated")
     domain_name: str = Field(..., description="Domain name for the data")
     file_id: str = Field(..., description="Unique file identifier (UUID)")
     policy_id: str = Field(..., description="Policy identifier (UUID)")
-    data: Dict[str, Any] = Field(..., description="The actual data object to be validated")
-    validation_rules: List[ValidationRule] = Field(..., description="List of validation rules to apply")
+    # min_length is enforced by pydantic-core, without a Python validator callback
+    data: Dict[str, Any] = Field(..., min_length=1, description="The actual data object to be validated")
+    validation_rules: List[ValidationRule] = Field(..., min_length=1, description="List of validation rules to apply")
+
+    @cached_property
+    def id_payload(self) -> Dict[str, Any]:
+        """The {"id": ...} data echoed back in responses, built once per entry"""
+        return {"id": self.data.get("id", "unknown")}
+
+# Legacy conversion builds the DataEntry itself rather than handing back a dict
+_ENTRY_ADAPTER = TypeAdapter(DataEntry)
+
+def _convert_legacy(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Lift an old-format message (no data_entry) into the current shape"""
+    # Old format: top-level 'data' and 'rules' fields
+    if 'data' in data and 'rules' in data:
+        legacy_data = data['data']
+        
+        data_entry = _ENTRY_ADAPTER.validate_python({
+            'data_type': 'tabular',  # Default assumption
+            'domain_name': 'Legacy',  # Default domain
+            'file_id': data.get('message_id', 'legacy-file-id'),
+            'policy_id': data.get('correlation_id', 'legacy-policy-id'),
+            'data': {'records': legacy_data} if isinstance(legacy_data, list) else legacy_data,
+            'validation_rules': data['rules']
+        })
+        return {'data_entry': data_entry}
     
-    @field_validator('data')
-    @classmethod
-    def validate_data_not_empty(cls, v):
-        if not v:
-            raise ValueError("Data cannot be empty")
-        return v
+    # Another old format: 'validation_rules' at top level
+    if 'validation_rules' in data:
+        data['data_entry'] = _ENTRY_ADAPTER.validate_python({
+            'data_type': 'tabular',
+            'domain_name': 'Legacy',
+            'file_id': 'legacy-file-id', 
+            'policy_id': 'legacy-policy-id',
+            'data': {},
+            'validation_rules': data.pop('validation_rules')
+        })
     
-    @field_validator('validation_rules')
-    @classmethod
-    def validate_rules_not_empty(cls, v):
-        if not v:
-            raise ValueError("Validation rules cannot be empty")
-        return v
+    return data
 
 class SQSValidationRequest(BaseModel):
     """
     Updated SQS input queue message format.
     Main wrapper containing the data_entry object.
-    Supports backward compatibility with old format.
     """
+    model_config = _MESSAGE_CONFIG
+
     data_entry: DataEntry = Field(..., description="Complete data entry with validation rules")
-    
+
+class LegacySQSValidationRequest(SQSValidationRequest):
+    """
+    Old SQS message formats (top-level data/rules or validation_rules),
+    lifted into a data_entry. Kept apart so current messages skip the conversion.
+    """
+
     @model_validator(mode='before')
     @classmethod
     def handle_legacy_format(cls, data):
         """Handle backward compatibility with old SQS message format"""
-        if isinstance(data, dict):
-            # Check if this is the old format (has 'data' and 'rules' fields)
-            if 'data' in data and 'rules' in data and 'data_entry' not in data:
-                # Convert old format to new format
-                legacy_data = data.get('data', [])
-                legacy_rules = data.get('rules', [])
-                
-                # Create DataEntry from legacy fields
-                data_entry = {
-                    'data_type': 'tabular',  # Default assumption
-                    'domain_name': 'Legacy',  # Default domain
-                    'file_id': data.get('message_id', 'legacy-file-id'),
-                    'policy_id': data.get('correlation_id', 'legacy-policy-id'),
-                    'data': {'records': legacy_data} if isinstance(legacy_data, list) else legacy_data,
-                    'validation_rules': legacy_rules
-                }
-                
-                return {'data_entry': data_entry}
-            
-            # Check if 'validation_rules' is at top level (another old format)
-            elif 'validation_rules' in data and 'data_entry' not in data:
-                # Move validation_rules into data_entry structure
-                validation_rules = data.pop('validation_rules')
-                
-                # Create basic data_entry if missing
-                if 'data_entry' not in data:
-                    data['data_entry'] = {
-                        'data_type': 'tabular',
-                        'domain_name': 'Legacy',
-                        'file_id': 'legacy-file-id', 
-                        'policy_id': 'legacy-policy-id',
-                        'data': {},
-                        'validation_rules': validation_rules
-                    }
-                
-        return data
-
-class ValidationResultDetail(BaseModel):
+        # Current-shape (or non-dict) input passes straight through
+        if not isinstance(data, dict) or 'data_entry' in data:
+            return data
+        return _convert_legacy(data)
+
+# Built once so inbound queue messages are parsed straight from JSON by pydantic-core
+VALIDATION_REQUEST_ADAPTER = TypeAdapter(SQSValidationRequest)
+LEGACY_REQUEST_ADAPTER = TypeAdapter(LegacySQSValidationRequest)
+
+def _is_missing_data_entry(error: ValidationError) -> bool:
+    """True when the only problem is that the body has no top-level data_entry key"""
+    return any(e['type'] == 'missing' and e['loc'] == ('data_entry',) for e in error.errors())
+
+def parse_request_bytes(body: Union[str, bytes]) -> SQSValidationRequest:
+    """Parse an inbound queue body, routing bodies without a data_entry through the legacy model"""
+    # Current-format bodies take the direct path, which keeps the parser's
+    # string cache; the legacy model's before-validator would bypass it
+    try:
+        return VALIDATION_REQUEST_ADAPTER.validate_json(body)
+    except ValidationError as e:
+        if not _is_missing_data_entry(e):
+            raise
+    return LEGACY_REQUEST_ADAPTER.validate_json(body)
+
+@dataclass(config=_OUTBOUND_RECORD_CONFIG, frozen=True, slots=True)
+class ValidationResultDetail:
     """Detailed result for a single validation rule"""
     rule_name: str = Field(..., description="Name of the validation rule")
     column_name: Optional[str] = Field(default=None, description="Column that was validated")
@@ -161,14 +209,16 @@ class ValidationResultDetail(BaseModel):
     # Detailed information
     expected: Optional[Any] = Field(default=None, description="Expected value or condition")
     actual: Optional[Any] = Field(default=None, description="Actual value or result")
-    details: Dict[str, Any] = Field(default={}, description="Additional validation details")
+    # Opaque payloads: a bare dict skips the per-key str check
+    details: dict = Field(default_factory=dict, description="Additional validation details")
     
     # Statistics
     element_count: Optional[int] = Field(default=None, description="Number of elements validated")
     unexpected_count: Optional[int] = Field(default=None, description="Number of elements that failed validation")
     unexpected_percent: Optional[float] = Field(default=None, description="Percentage of elements that failed")
 
-class ValidationSummary(BaseModel):
+@dataclass(config=_OUTBOUND_RECORD_CONFIG, frozen=True, slots=True)
+class ValidationSummary:
     """Summary statistics for validation results"""
     total_rules: int = Field(..., description="Total number of rules executed")
     successful_rules: int = Field(..., description="Number of rules that passed")
@@ -185,35 +235,78 @@ class ValidationSummary(BaseModel):
 
 class ValidationResult(BaseModel):
     """Container for complete validation results"""
-    validation_results: List[ValidationResultDetail] = Field(default=[], description="Detailed validation results")
+    model_config = _RESULT_CONFIG
+
+    validation_results: List[ValidationResultDetail] = Field(default_factory=list, description="Detailed validation results")
     summary: ValidationSummary = Field(..., description="Validation summary statistics")
     
     # Processing metadata
-    processed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Processing completion timestamp")
+    processed_at: EpochMsDatetime = Field(default_factory=_utcnow, description="Processing completion timestamp")
     processing_time_ms: int = Field(..., description="Total processing time in milliseconds")
     status: MessageStatus = Field(..., description="Overall processing status")
 
 class FailedValidation(BaseModel):
     """Failed validation details"""
+    model_config = _OUTBOUND_CONFIG
+
     rule_name: str = Field(..., description="Name of the failed rule")
     column_name: str = Field(..., description="Column name that failed validation")
     error_message: str = Field(..., description="Error message for this validation failure")
-    status: str = Field(default="fail", description="Status of the validation")
+    status: ResultStatusT = Field(default="fail", description="Status of the validation")
 
 class SQSValidationResponse(BaseModel):
     """
     Updated SQS output queue message format to match the required outbound format.
     """
+    model_config = _OUTBOUND_CONFIG
+
     file_id: str = Field(..., description="File identifier")
     policy_id: str = Field(..., description="Policy identifier")
-    data_type: str = Field(..., description="Type of data")
-    status: str = Field(..., description="Overall validation status: 'success' or 'fail'")
+    data_type: DataTypeT = Field(..., description="Type of data")
+    status: ResultStatusT = Field(..., description="Overall validation status: 'success' or 'fail'")
     domain_name: str = Field(..., description="Domain name")
     data: Dict[str, Any] = Field(..., description="Data with ID")
     failed_validations: Optional[List[FailedValidation]] = Field(default=None, description="Failed validations if any")
 
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "SQSValidationResponse":
+        """
+        Build a response from values computed by the engine itself, skipping validation.
+
+        Only for server-side assembly: callers must pass already-correct types
+        (including FailedValidation instances). model_construct ignores
+        extra='forbid' and the Literal fields, so field names, status and
+        data_type are checked here with set lookups.
+        """
+        unknown = data.keys() - cls.model_fields.keys()
+        if unknown:
+            raise TypeError(f"Unexpected SQSValidationResponse fields: {', '.join(sorted(unknown))}")
+        if data.get('status') not in _RESULT_STATUS_VALUES:
+            raise ValueError(f"Invalid response status: {data.get('status')!r}")
+        if data.get('data_type') not in _DATA_TYPE_VALUES:
+            raise ValueError(f"Invalid response data_type: {data.get('data_type')!r}")
+        return cls.model_construct(**data)
+
+# Serializes outbound results straight to JSON bytes
+RESPONSE_ADAPTER = TypeAdapter(SQSValidationResponse)
+dump_response_bytes = RESPONSE_ADAPTER.dump_json
+
+# Success responses carry no failed_validations; dropping the null keeps the
+# outbound body smaller. Failures are dumped in full.
+dump_success_bytes = partial(RESPONSE_ADAPTER.dump_json, exclude_none=True)
+_dump_success_payload = partial(RESPONSE_ADAPTER.dump_python, mode='json', exclude_none=True)
+_dump_full_payload = partial(RESPONSE_ADAPTER.dump_python, mode='json')
+
+def dump_response_payload(response: "SQSValidationResponse") -> Dict[str, Any]:
+    """JSON-ready dict for the output queue, trimmed for success responses"""
+    if response.status == "success":
+        return _dump_success_payload(response)
+    return _dump_full_payload(response)
+
 class SQSMessageWrapper(BaseModel):
     """Wrapper for SQS message with metadata"""
+    model_config = _MESSAGE_CONFIG
+
     
     # SQS Message Info
     receipt_handle: str = Field(..., description="SQS receipt handle for message deletion")
@@ -223,14 +316,16 @@ class SQSMessageWrapper(BaseModel):
     body: SQSValidationRequest = Field(..., description="Parsed message body")
     
     # Processing Metadata
-    received_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Message received timestamp")
+    received_at: EpochMsDatetime = Field(default_factory=_utcnow, description="Message received timestamp")
     attempts: int = Field(default=1, description="Processing attempt count")
     
     # SQS Attributes
-    attributes: Dict[str, Any] = Field(default={}, description="SQS message attributes")
+    attributes: dict = Field(default_factory=dict, description="SQS message attributes")
 
 class ProcessingResult(BaseModel):
     """Result of message processing"""
+    model_config = _OUTBOUND_CONFIG
+
     
     success: bool = Field(..., description="Whether processing was successful")
     message_id: str = Field(..., description="Message identifier")
@@ -248,19 +343,16 @@ class ProcessingResult(BaseModel):
 # Helper functions for backward compatibility and easy access
 def get_dataset_from_request(request: SQSValidationRequest) -> List[Dict[str, Any]]:
     """Extract dataset in list format from the new request structure"""
-    data = request.data_entry.data
-    if isinstance(data, dict):
-        # Convert single data object to list format expected by validators
-        return [data]
-    elif isinstance(data, list):
-        return data
-    else:
-        raise ValueError("Data must be a dictionary or list of dictionaries")
+    # DataEntry.data is validated as a single dict; validators expect a list of rows
+    return [request.data_entry.data]
 
 def get_validation_rules_from_request(request: SQSValidationRequest) -> List[ValidationRule]:
     """Extract validation rules from the new request structure"""
     return request.data_entry.validation_rules
 
+# Indexed by "no failed rules"
+_OVERALL_STATUS = ("fail", "success")
+
 def create_response_from_request_and_results(
     request: SQSValidationRequest, 
     validation_results: List[ValidationResultDetail],
@@ -271,30 +363,30 @@ def create_response_from_request_and_results(
     """Create a response from request and validation results in the new outbound format"""
     
     # Determine overall status
-    overall_status = "success" if summary.failed_rules == 0 else "fail"
+    overall_status = _OVERALL_STATUS[summary.failed_rules == 0]
     
-    # Create failed validations if there are any failures
+    # One FailedValidation per failed result, built in a single pass
     failed_validations = None
     if summary.failed_rules > 0:
-        failed_validations = []
-        
-        # Create one FailedValidation for each failed result
-        for result in validation_results:
-            if not result.success:
-                failed_validation = FailedValidation(
-                    rule_name=result.rule_name,
-                    column_name=result.column_name or "unknown",
-                    error_message=result.message or f"Validation failed for rule {result.rule_name}",
-                    status="fail"
-                )
-                failed_validations.append(failed_validation)
+        construct = FailedValidation.model_construct
+        failed_validations = [
+            construct(
+                rule_name=result.rule_name,
+                column_name=result.column_name or "unknown",
+                error_message=result.message or f"Validation failed for rule {result.rule_name}",
+                status="fail"
+            )
+            for result in validation_results
+            if not result.success
+        ]
     
-    return SQSValidationResponse(
+    # Every field below comes from an already-validated request or our own results
+    return SQSValidationResponse.build_trusted(
         file_id=request.data_entry.file_id,
         policy_id=request.data_entry.policy_id,
         data_type=request.data_entry.data_type.value,
         status=overall_status,
         domain_name=request.data_entry.domain_name,
-        data={"id": request.data_entry.data.get("id", "unknown")},
+        data=request.data_entry.id_payload,
         failed_validations=failed_validations
     )
@@ -2,43 +2,26 @@
 Simplified validation models for the rules engine.
 This module provides consistent input/output types across API and SQS interfaces.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timezone
-from enum import Enum
+from functools import partial
 
-# ============================================================================
-# ENUMS AND CONSTANTS
-# ============================================================================
+# Shared with sqs_models; re-exported here for existing imports
+from .enums import DataType, MessageStatus, RuleSeverity
 
-class DataType(str, Enum):
-    """Supported data types for validation"""
-    TABULAR = "tabular"         # Pandas DataFrame-like data
-    JSON = "json"               # JSON object data
-    CSV = "csv"                 # CSV format data
-    PARQUET = "parquet"         # Parquet format data
-    DATABASE = "database"       # Database query result
-
-class MessageStatus(str, Enum):
-    """Message processing status"""
-    PENDING = "pending"
-    PROCESSING = "processing"
-    SUCCESS = "success"
-    FAILED = "failed"
-    RETRY = "retry"
-    DLQ = "dlq"
-
-class RuleSeverity(str, Enum):
-    """Validation rule severity levels"""
-    ERROR = "error"
-    WARNING = "warning"
-    INFO = "info"
+# Same timestamp factory as sqs_models; no lambda frame per default
+_utcnow = partial(datetime.now, timezone.utc)
 
 # ============================================================================
 # CORE VALIDATION MODELS
 # ============================================================================
 
-class ValidationRule(BaseModel):
+# Rules arrive many per request and are only read afterwards, so they are
+# slotted, frozen pydantic dataclasses rather than BaseModels
+@dataclass(config=ConfigDict(extra='ignore'), frozen=True, slots=True)
+class ValidationRule:
     """
     Unified validation rule model following Great Expectations format.
     Used consistently across API and SQS interfaces.
@@ -100,6 +83,14 @@ class ValidationResponse(BaseModel):
     results: List[ValidationResultDetail] = Field(..., description="Detailed validation results")
     summary: ValidationSummary = Field(..., description="Validation summary statistics")
 
+class ValidationJobResponse(BaseModel):
+    """Status of an asynchronous validation job"""
+    job_id: str = Field(..., description="Validation job identifier")
+    status: MessageStatus = Field(..., description="Current job status")
+    status_url: str = Field(..., description="URL to poll for the job status")
+    result: Optional[ValidationResponse] = Field(default=None, description="Validation response once the job succeeded")
+    error: Optional[str] = Field(default=None, description="Error message if the job failed")
+
 # ============================================================================
 # LEGACY SUPPORT MODELS
 # ============================================================================
@@ -128,6 +119,9 @@ class LegacyValidationSummary(BaseModel):
 
 class LegacyValidationResponse(BaseModel):
     """Legacy validation response format"""
+    # Rarely used; build the schema on first use instead of at import
+    model_config = ConfigDict(defer_build=True)
+
     result: List[Dict[str, Any]]  # Legacy field name
     total_rules: int
     successful_rules: int
@@ -139,6 +133,9 @@ class LegacyValidationResponse(BaseModel):
 
 class DataEntry(BaseModel):
     """Enhanced data entry with metadata"""
+    # Store data_type as its string value
+    model_config = ConfigDict(use_enum_values=True)
+
     data_type: DataType = Field(..., description="Type of data being validated")
     data_key: str = Field(..., description="Unique identifier for this dataset")
     
@@ -149,11 +146,11 @@ class DataEntry(BaseModel):
     # Metadata
     source: Optional[str] = Field(default=None, description="Data source")
     schema_version: Optional[str] = Field(default="1.0", description="Data schema version")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Creation timestamp")
+    created_at: datetime = Field(default_factory=_utcnow, description="Creation timestamp")
 
 class ProcessingMetadata(BaseModel):
     """Processing metadata for validation results"""
-    processed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    processed_at: datetime = Field(default_factory=_utcnow)
     processing_time_ms: int = Field(..., description="Processing time in milliseconds")
     worker_id: Optional[str] = Field(default=None, description="Worker that processed the request")
     batch_id: Optional[str] = Field(default=None, description="Batch identifier")
@@ -162,7 +159,7 @@ class EnhancedValidationRequest(BaseModel):
     """Enhanced validation request with metadata"""
     message_id: str = Field(..., description="Unique message identifier")
     correlation_id: Optional[str] = Field(default=None, description="Correlation ID")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_utcnow)
     source: Optional[str] = Field(default=None, description="Source system")
     
     # Core validation data
@@ -175,6 +172,8 @@ class EnhancedValidationRequest(BaseModel):
 
 class EnhancedValidationResponse(BaseModel):
     """Enhanced validation response with metadata"""
+    model_config = ConfigDict(defer_build=True, use_enum_values=True)
+
     message_id: str = Field(..., description="Original message identifier")
     correlation_id: Optional[str] = Field(default=None, description="Correlation ID")
     
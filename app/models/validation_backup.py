@@ -2,42 +2,45 @@
 Unified validation models for the rules engine.
 This module provides consistent input/output types across API and SQS interfaces.
 """
-from pydantic import BaseModel, Field, field_validator, validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timezone
-from enum import Enum
+from functools import partial
 
-# ============================================================================
-# ENUMS AND CONSTANTS
-# ============================================================================
-
-class DataType(str, Enum):
-    """Supported data types for validation"""
-    TABULAR = "tabular"         # Pandas DataFrame-like data
-    JSON = "json"               # JSON object data
-    CSV = "csv"                 # CSV format data
-    PARQUET = "parquet"         # Parquet format data
-    DATABASE = "database"       # Database query result
+# Shared with sqs_models; re-exported here for existing imports
+from .enums import DataType, MessageStatus, RuleSeverity
 
-class MessageStatus(str, Enum):
-    """Message processing status"""
-    PENDING = "pending"
-    PROCESSING = "processing"
-    SUCCESS = "success"
-    FAILED = "failed"
-    RETRY = "retry"
-    DLQ = "dlq"
+# Same timestamp factory as sqs_models; no lambda frame per default
+_utcnow = partial(datetime.now, timezone.utc)
 
-class RuleSeverity(str, Enum):
-    """Validation rule severity levels"""
-    ERROR = "error"
-    WARNING = "warning"
-    INFO = "info"
+# Nothing on the request path uses this module's SQS models, so their schemas
+# are built on first use rather than when the module is imported
+_DEFERRED_CONFIG = ConfigDict(defer_build=True)
 
 # ============================================================================
 # CORE VALIDATION MODELS
 # ============================================================================
 
+def _sync_legacy_pairs(data: Any, pairs, missing=lambda v: not v) -> Any:
+    """
+    Fill each (current, legacy) field pair from whichever side was provided.
+
+    Runs once per model as a single before-validator instead of one callback
+    per legacy field; the input dict is only copied when something changes.
+    """
+    if not isinstance(data, dict):
+        return data
+    synced = None
+    for current, legacy in pairs:
+        current_value, legacy_value = data.get(current), data.get(legacy)
+        if missing(legacy_value) and not missing(current_value):
+            synced = synced if synced is not None else dict(data)
+            synced[legacy] = current_value
+        elif missing(current_value) and not missing(legacy_value):
+            synced = synced if synced is not None else dict(data)
+            synced[current] = legacy_value
+    return synced if synced is not None else data
+
 class ValidationRule(BaseModel):
     """
     Unified validation rule model following Great Expectations format.
@@ -63,25 +66,11 @@ class ValidationRule(BaseModel):
     expectation_type: Optional[str] = Field(default=None, description="Legacy field, use rule_name instead")
     kwargs: Optional[Dict[str, Any]] = Field(default=None, description="Legacy field, use value instead")
     
-    @field_validator('expectation_type', mode='before')
-    @classmethod
-    def sync_expectation_type(cls, v, info):
-        """Sync legacy expectation_type with rule_name"""
-        if v and not info.data.get('rule_name'):
-            info.data['rule_name'] = v
-        elif info.data.get('rule_name') and not v:
-            return info.data['rule_name']
-        return v
-    
-    @field_validator('kwargs', mode='before')
+    @model_validator(mode='before')
     @classmethod
-    def sync_kwargs(cls, v, info):
-        """Sync legacy kwargs with value"""
-        if v and not info.data.get('value'):
-            info.data['value'] = v
-        elif info.data.get('value') and not v:
-            return info.data['value']
-        return v
+    def sync_legacy_fields(cls, data):
+        """Sync legacy expectation_type/kwargs with rule_name/value"""
+        return _sync_legacy_pairs(data, (('rule_name', 'expectation_type'), ('value', 'kwargs')))
 
 class ValidationResultDetail(BaseModel):
     """Detailed result for a single validation rule"""
@@ -104,23 +93,11 @@ class ValidationResultDetail(BaseModel):
     rule: Optional[str] = Field(default=None, description="Legacy field, use rule_name instead")
     column: Optional[str] = Field(default=None, description="Legacy field, use column_name instead")
     
-    @validator('rule', pre=True, always=True)
-    def sync_rule(cls, v, values):
-        """Sync legacy rule with rule_name"""
-        if values.get('rule_name') and not v:
-            return values['rule_name']
-        elif v and not values.get('rule_name'):
-            values['rule_name'] = v
-        return v
-    
-    @validator('column', pre=True, always=True)
-    def sync_column(cls, v, values):
-        """Sync legacy column with column_name"""
-        if values.get('column_name') and not v:
-            return values['column_name']
-        elif v and not values.get('column_name'):
-            values['column_name'] = v
-        return v
+    @model_validator(mode='before')
+    @classmethod
+    def sync_legacy_fields(cls, data):
+        """Sync legacy rule/column with rule_name/column_name"""
+        return _sync_legacy_pairs(data, (('rule_name', 'rule'), ('column_name', 'column')))
 
 class ValidationSummary(BaseModel):
     """Summary statistics for validation results"""
@@ -141,23 +118,13 @@ class ValidationSummary(BaseModel):
     passed: Optional[int] = Field(default=None, description="Legacy field, use successful_rules instead")
     failed: Optional[int] = Field(default=None, description="Legacy field, use failed_rules instead")
     
-    @validator('passed', pre=True, always=True)
-    def sync_passed(cls, v, values):
-        """Sync legacy passed with successful_rules"""
-        if values.get('successful_rules') is not None and v is None:
-            return values['successful_rules']
-        elif v is not None and values.get('successful_rules') is None:
-            values['successful_rules'] = v
-        return v
-    
-    @validator('failed', pre=True, always=True)
-    def sync_failed(cls, v, values):
-        """Sync legacy failed with failed_rules"""
-        if values.get('failed_rules') is not None and v is None:
-            return values['failed_rules']
-        elif v is not None and values.get('failed_rules') is None:
-            values['failed_rules'] = v
-        return v
+    @model_validator(mode='before')
+    @classmethod
+    def sync_legacy_fields(cls, data):
+        """Sync legacy passed/failed with successful_rules/failed_rules"""
+        return _sync_legacy_pairs(
+            data, (('successful_rules', 'passed'), ('failed_rules', 'failed')), missing=lambda v: v is None
+        )
 
 # ============================================================================
 # INPUT MODELS
@@ -168,25 +135,14 @@ class ValidationRequest(BaseModel):
     Core validation request model.
     Used for API endpoints and as base for SQS messages.
     """
-    dataset: List[Dict[str, Any]] = Field(..., description="Data to validate as list of dictionaries")
-    rules: List[ValidationRule] = Field(..., description="Validation rules to apply")
+    # min_length is enforced by pydantic-core, without a Python validator callback
+    dataset: List[Dict[str, Any]] = Field(..., min_length=1, description="Data to validate as list of dictionaries")
+    rules: List[ValidationRule] = Field(..., min_length=1, description="Validation rules to apply")
     
     # Optional metadata
     data_key: Optional[str] = Field(default=None, description="Unique identifier for this dataset")
     data_type: DataType = Field(default=DataType.TABULAR, description="Type of data being validated")
     source: Optional[str] = Field(default=None, description="Data source identifier")
-    
-    @validator('dataset')
-    def validate_dataset_not_empty(cls, v):
-        if not v:
-            raise ValueError("Dataset cannot be empty")
-        return v
-    
-    @validator('rules')
-    def validate_rules_not_empty(cls, v):
-        if not v:
-            raise ValueError("Rules cannot be empty")
-        return v
 
 class DataEntry(BaseModel):
     """
@@ -197,41 +153,30 @@ class DataEntry(BaseModel):
     data_key: str = Field(..., description="Unique identifier for this dataset")
     
     # Data Content
-    columns: List[str] = Field(..., description="List of column names in the dataset")
-    data: List[Dict[str, Any]] = Field(..., description="Actual data rows as list of dictionaries")
+    columns: List[str] = Field(..., min_length=1, description="List of column names in the dataset")
+    data: List[Dict[str, Any]] = Field(..., min_length=1, description="Actual data rows as list of dictionaries")
     
     # Metadata
     source: Optional[str] = Field(default=None, description="Data source (file path, table name, etc.)")
     schema_version: str = Field(default="1.0", description="Data schema version")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Data creation timestamp")
-    
-    @validator('data')
-    def validate_data_not_empty(cls, v):
-        if not v:
-            raise ValueError("Data cannot be empty")
-        return v
-    
-    @validator('columns')
-    def validate_columns_not_empty(cls, v):
-        if not v:
-            raise ValueError("Columns list cannot be empty")
-        return v
+    created_at: datetime = Field(default_factory=_utcnow, description="Data creation timestamp")
 
 class SQSValidationRequest(BaseModel):
     """
     Enhanced SQS input queue message format.
     Extends ValidationRequest with messaging and processing metadata.
     """
+    model_config = _DEFERRED_CONFIG
     
     # Message Metadata
     message_id: str = Field(..., description="Unique message identifier")
     correlation_id: Optional[str] = Field(default=None, description="Correlation ID for tracking related messages")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Message creation timestamp")
+    timestamp: datetime = Field(default_factory=_utcnow, description="Message creation timestamp")
     source: Optional[str] = Field(default=None, description="Source system or application")
     
     # Primary validation content (using enhanced model)
     data_entry: Optional[DataEntry] = Field(default=None, description="Enhanced dataset with metadata")
-    validation_rules: List[ValidationRule] = Field(..., description="List of validation rules to apply")
+    validation_rules: List[ValidationRule] = Field(..., min_length=1, description="List of validation rules to apply")
     
     # Legacy support for backward compatibility
     data: Optional[List[Dict[str, Any]]] = Field(default=None, description="Legacy data field (use data_entry instead)")
@@ -247,17 +192,13 @@ class SQSValidationRequest(BaseModel):
     max_retries: int = Field(default=3, ge=0, description="Maximum retry attempts")
     retry_count: int = Field(default=0, ge=0, description="Current retry count")
     
-    @validator('validation_rules', pre=True, always=True)
-    def ensure_validation_rules(cls, v, values):
-        """Ensure validation_rules is populated from legacy fields if needed"""
-        if not v:
-            # Try to get from legacy rules field
-            legacy_rules = values.get('rules')
-            if legacy_rules:
-                return legacy_rules
-            else:
-                raise ValueError("validation_rules cannot be empty")
-        return v
+    @model_validator(mode='before')
+    @classmethod
+    def ensure_validation_rules(cls, data):
+        """Populate validation_rules from the legacy rules field if needed"""
+        if isinstance(data, dict) and not data.get('validation_rules') and data.get('rules'):
+            data = {**data, 'validation_rules': data['rules']}
+        return data
     
     def get_dataset(self) -> List[Dict[str, Any]]:
         """Get dataset from enhanced or legacy format"""
@@ -297,7 +238,7 @@ class ValidationResponse(BaseModel):
     summary: ValidationSummary = Field(..., description="Validation summary statistics")
     
     # Processing metadata
-    processed_at: datetime = Field(default_factory=datetime.utcnow, description="Processing completion timestamp")
+    processed_at: datetime = Field(default_factory=_utcnow, description="Processing completion timestamp")
     execution_time_ms: int = Field(default=0, description="Total execution time in milliseconds")
 
 class SQSValidationResponse(BaseModel):
@@ -305,11 +246,12 @@ class SQSValidationResponse(BaseModel):
     Enhanced SQS output queue message format.
     Extends ValidationResponse with messaging and processing metadata.
     """
+    model_config = _DEFERRED_CONFIG
     
     # Message Metadata
     message_id: str = Field(..., description="Original message identifier")
     correlation_id: Optional[str] = Field(default=None, description="Correlation ID from request")
-    processed_at: datetime = Field(default_factory=datetime.utcnow, description="Processing completion timestamp")
+    processed_at: datetime = Field(default_factory=_utcnow, description="Processing completion timestamp")
     processing_time_ms: int = Field(..., description="Total processing time in milliseconds")
     
     # Processing Status
@@ -340,14 +282,11 @@ class SQSValidationResponse(BaseModel):
     successful_rules: Optional[int] = Field(default=None, description="Legacy field, use summary.successful_rules instead")
     failed_rules: Optional[int] = Field(default=None, description="Legacy field, use summary.failed_rules instead")
     
-    @validator('results', pre=True, always=True)
-    def sync_results(cls, v, values):
+    @model_validator(mode='before')
+    @classmethod
+    def sync_legacy_fields(cls, data):
         """Sync legacy results with validation_results"""
-        if values.get('validation_results') and not v:
-            return values['validation_results']
-        elif v and not values.get('validation_results'):
-            values['validation_results'] = v
-        return v
+        return _sync_legacy_pairs(data, (('validation_results', 'results'),))
 
 # ============================================================================
 # PROCESSING MODELS
@@ -355,6 +294,7 @@ class SQSValidationResponse(BaseModel):
 
 class SQSMessageWrapper(BaseModel):
     """Wrapper for SQS message with metadata"""
+    model_config = _DEFERRED_CONFIG
     
     # SQS Message Info
     receipt_handle: str = Field(..., description="SQS receipt handle for message deletion")
@@ -364,7 +304,7 @@ class SQSMessageWrapper(BaseModel):
     body: SQSValidationRequest = Field(..., description="Parsed message body")
     
     # Processing Metadata
-    received_at: datetime = Field(default_factory=datetime.utcnow, description="Message received timestamp")
+    received_at: datetime = Field(default_factory=_utcnow, description="Message received timestamp")
     attempts: int = Field(default=1, description="Processing attempt count")
     
     # SQS Attributes
@@ -372,6 +312,7 @@ class SQSMessageWrapper(BaseModel):
 
 class ProcessingResult(BaseModel):
     """Result of message processing"""
+    model_config = _DEFERRED_CONFIG
     
     success: bool = Field(..., description="Whether processing was successful")
     message_id: str = Field(..., description="Message identifier")
@@ -390,6 +331,8 @@ class ProcessingResult(BaseModel):
 # UTILITY FUNCTIONS
 # ============================================================================
 
+_MISSING = object()
+
 def convert_legacy_rule(rule_dict: Dict[str, Any]) -> ValidationRule:
     """
     Convert legacy rule format to unified ValidationRule format.
@@ -400,26 +343,27 @@ def convert_legacy_rule(rule_dict: Dict[str, Any]) -> ValidationRule:
     Returns:
         ValidationRule instance
     """
-    # Handle different legacy formats
-    if 'expectation_type' in rule_dict:
-        # Great Expectations format
+    # Single lookup decides the Great Expectations format
+    expectation_type = rule_dict.get('expectation_type', _MISSING)
+    if expectation_type is not _MISSING:
+        kwargs = rule_dict.get('kwargs', {})
         return ValidationRule(
-            rule_name=rule_dict['expectation_type'],
-            column_name=rule_dict.get('kwargs', {}).get('column'),
-            value=rule_dict.get('kwargs', {}),
-            expectation_type=rule_dict['expectation_type'],
-            kwargs=rule_dict.get('kwargs', {})
-        )
-    elif 'rule_name' in rule_dict:
-        # New unified format
-        return ValidationRule(**rule_dict)
-    else:
-        # Try to infer format
-        return ValidationRule(
-            rule_name=rule_dict.get('rule_name', 'unknown'),
-            column_name=rule_dict.get('column_name'),
-            value=rule_dict.get('value')
+            rule_name=expectation_type,
+            column_name=kwargs.get('column'),
+            value=kwargs,
+            expectation_type=expectation_type,
+            kwargs=kwargs
         )
+    if 'rule_name' in rule_dict:
+        # New unified format; hand the dict straight to the compiled
+        # pydantic-core validator instead of re-packing it as kwargs
+        return ValidationRule.model_validate(rule_dict)
+    # Try to infer format
+    return ValidationRule(
+        rule_name='unknown',
+        column_name=rule_dict.get('column_name'),
+        value=rule_dict.get('value')
+    )
 
 def convert_legacy_validation_request(request_dict: Dict[str, Any]) -> ValidationRequest:
     """
@@ -432,12 +376,10 @@ def convert_legacy_validation_request(request_dict: Dict[str, Any]) -> Validatio
         ValidationRequest instance
     """
     # Convert rules
-    rules = []
-    for rule in request_dict.get('rules', []):
-        if isinstance(rule, dict):
-            rules.append(convert_legacy_rule(rule))
-        else:
-            rules.append(rule)
+    rules = [
+        convert_legacy_rule(rule) if isinstance(rule, dict) else rule
+        for rule in request_dict.get('rules', ())
+    ]
     
     return ValidationRequest(
         dataset=request_dict.get('dataset', request_dict.get('data', [])),
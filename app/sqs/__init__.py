@@ -19,8 +19,16 @@ from ..models.sqs_models import (
     ProcessingResult
 )
 from .client import SQSClient
+from .batcher import MessageBatcher
 from .processor import MessageProcessor
-from .manager import SQSManager, get_sqs_manager, start_sqs_processing, stop_sqs_processing
+from .manager import (
+    SQSManager,
+    get_sqs_manager,
+    start_sqs_processing,
+    stop_sqs_processing,
+    schedule_sqs_processing,
+    cancel_sqs_processing_task
+)
 
 __all__ = [
     'SQSSettings',
@@ -31,9 +39,12 @@ __all__ = [
     'MessageStatus',
     'ProcessingResult',
     'SQSClient',
+    'MessageBatcher',
     'MessageProcessor',
     'SQSManager',
     'get_sqs_manager',
     'start_sqs_processing',
-    'stop_sqs_processing'
+    'stop_sqs_processing',
+    'schedule_sqs_processing',
+    'cancel_sqs_processing_task'
 ]
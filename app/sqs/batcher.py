@@ -0,0 +1,89 @@
+"""
+Coalescing sender that groups individual SQS sends into SendMessageBatch calls.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .client import SQSClient, SQS_BATCH_LIMIT
+
+logger = logging.getLogger(__name__)
+
+MessageBody = Union[Dict[str, Any], str]
+
+class MessageBatcher:
+    """
+    Buffers messages for one queue and flushes them with send_message_batch.
+
+    A batch is flushed as soon as it reaches max_batch_size messages, or
+    max_wait_seconds after its first message arrived, whichever comes first.
+    Each caller awaits its own message ID (None if SQS rejected the message).
+    """
+
+    def __init__(self, sqs_client: SQSClient, queue_url: Optional[str] = None,
+                 max_batch_size: int = SQS_BATCH_LIMIT, max_wait_seconds: float = 0.01):
+        self.sqs_client = sqs_client
+        self.queue_url = queue_url
+        self.max_batch_size = min(max_batch_size, SQS_BATCH_LIMIT)
+        self.max_wait_seconds = max_wait_seconds
+        self._pending: List[Tuple[asyncio.Future, MessageBody]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: set = set()
+
+    async def send(self, message_body: MessageBody) -> Optional[str]:
+        """
+        Queue a message for the next batch and wait until it has been sent
+
+        Args:
+            message_body: Message content, either a dict or an already serialized JSON string
+
+        Returns:
+            Message ID if successful, None otherwise
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((future, message_body))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self._start_flush)
+
+        return await future
+
+    async def flush(self) -> None:
+        """Send anything still buffered and wait for in-flight batches"""
+        self._start_flush()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._send_batch(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _send_batch(self, batch: List[Tuple[asyncio.Future, MessageBody]]) -> None:
+        try:
+            # boto3 is blocking; keep the event loop free while the batch is in flight
+            message_ids = await asyncio.to_thread(
+                self.sqs_client.send_message_batch,
+                [body for _, body in batch],
+                self.queue_url
+            )
+        except Exception as e:
+            logger.error("Failed to send message batch: %s", e)
+            for future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (future, _), message_id in zip(batch, message_ids):
+            if not future.done():
+                future.set_result(message_id)
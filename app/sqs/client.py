@@ -4,15 +4,41 @@ AWS SQS Client for managing queue operations.
 import boto3
 import json
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
+from botocore.config import Config
 from botocore.exceptions import ClientError, BotoCoreError
-from datetime import datetime
+from datetime import datetime, timezone
 
 from .config import SQSSettings
-from ..models.sqs_models import SQSMessageWrapper, SQSValidationRequest
+from ..models.sqs_models import SQSMessageWrapper, parse_request_bytes
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of entries SQS accepts in a single SendMessageBatch call
+SQS_BATCH_LIMIT = 10
+
+# Maximum payload, in bytes, of one message and of a whole SendMessageBatch call
+SQS_BATCH_MAX_BYTES = 262_144
+
+# Pooled connections kept beyond one per worker, for the status and send-message endpoints
+SQS_POOL_HEADROOM = 10
+
+def build_client_config(settings: SQSSettings) -> Config:
+    """
+    botocore config shared by every call made through an SQSClient
+
+    The pool is sized so each worker's long poll plus the API endpoints can
+    reuse a kept-alive TLS connection instead of opening a new one per call.
+    The read timeout outlasts the longest long-poll wait SQS allows (20s).
+    """
+    return Config(
+        max_pool_connections=settings.worker_count + SQS_POOL_HEADROOM,
+        tcp_keepalive=True,
+        connect_timeout=2,
+        read_timeout=30,
+        retries={"mode": "adaptive", "max_attempts": 5}
+    )
+
 class SQSClient:
     """AWS SQS Client for queue operations"""
     
@@ -30,7 +56,7 @@ class SQSClient:
                 region_name=self.settings.aws_region
             )
             
-            self.sqs = session.client('sqs')
+            self.sqs = session.client('sqs', config=build_client_config(self.settings))
             logger.info(f"SQS client connected to region: {self.settings.aws_region}")
 
         except Exception as e:
@@ -62,18 +88,20 @@ class SQSClient:
             
             messages = response.get('Messages', [])
             wrapped_messages = []
+            # One receive call, one timestamp shared by every message in it
+            received_at = datetime.now(timezone.utc)
             
             for message in messages:
                 try:
-                    # Parse message body
-                    body_data = json.loads(message['Body'])
-                    validation_request = SQSValidationRequest(**body_data)
+                    # Parse and validate the message body in one pass
+                    validation_request = parse_request_bytes(message['Body'])
                     
                     # Create wrapped message
                     wrapped_message = SQSMessageWrapper(
                         receipt_handle=message['ReceiptHandle'],
                         message_id=message['MessageId'],
                         body=validation_request,
+                        received_at=received_at,
                         attributes=message.get('Attributes', {})
                     )
                     
@@ -123,13 +151,13 @@ class SQSClient:
             logger.error(f"Failed to delete message: {e}")
             return False
 
-    def send_message(self, message_body: Dict[str, Any], queue_url: Optional[str] = None, 
+    def send_message(self, message_body: Union[Dict[str, Any], str], queue_url: Optional[str] = None, 
                     delay_seconds: int = 0, message_attributes: Optional[Dict] = None) -> Optional[str]:
         """
         Send message to queue
         
         Args:
-            message_body: Message content
+            message_body: Message content, either a dict or an already serialized JSON string
             queue_url: Queue URL (defaults to output queue)
             delay_seconds: Message delay
             message_attributes: Message attributes
@@ -143,7 +171,7 @@ class SQSClient:
         try:
             params = {
                 'QueueUrl': queue_url,
-                'MessageBody': json.dumps(message_body, default=str)
+                'MessageBody': message_body if isinstance(message_body, str) else json.dumps(message_body, default=str)
             }
             
             if delay_seconds > 0:
@@ -162,6 +190,60 @@ class SQSClient:
             logger.error(f"Failed to send message: {e}")
             return None
 
+    def send_message_batch(self, message_bodies: List[Union[Dict[str, Any], str]],
+                           queue_url: Optional[str] = None) -> List[Optional[str]]:
+        """
+        Send several messages to a queue, up to SQS_BATCH_LIMIT messages and
+        SQS_BATCH_MAX_BYTES of bodies per API call. A body that is over the
+        size limit on its own is not sent and gets None.
+
+        Args:
+            message_bodies: Message contents, each a dict or an already serialized JSON string
+            queue_url: Queue URL (defaults to output queue)
+
+        Returns:
+            Message IDs in the order of message_bodies, None for messages that failed
+        """
+        if not queue_url:
+            queue_url = self.settings.get_output_queue_url()
+
+        message_ids: List[Optional[str]] = [None] * len(message_bodies)
+
+        for entries in self._batch_entries(message_bodies):
+            try:
+                response = self.sqs.send_message_batch(QueueUrl=queue_url, Entries=entries)
+            except ClientError as e:
+                logger.error(f"Failed to send message batch: {e}")
+                continue
+
+            for entry in response.get('Successful', []):
+                message_ids[int(entry['Id'])] = entry['MessageId']
+            for entry in response.get('Failed', []):
+                logger.error(f"Failed to send message in batch: {entry.get('Code')} {entry.get('Message')}")
+
+        logger.debug(f"Batch sent: {sum(1 for m in message_ids if m)}/{len(message_bodies)} messages")
+        return message_ids
+
+    @staticmethod
+    def _batch_entries(message_bodies: List[Union[Dict[str, Any], str]]):
+        """Yield SendMessageBatch entry lists that respect both the count and size limits"""
+        entries: List[Dict[str, str]] = []
+        batch_bytes = 0
+        for index, body in enumerate(message_bodies):
+            text = body if isinstance(body, str) else json.dumps(body, default=str)
+            body_bytes = len(text.encode('utf-8'))
+            if body_bytes > SQS_BATCH_MAX_BYTES:
+                logger.error("Message %d not sent: %d bytes exceeds the SQS limit of %d",
+                             index, body_bytes, SQS_BATCH_MAX_BYTES)
+                continue
+            if entries and (len(entries) == SQS_BATCH_LIMIT or batch_bytes + body_bytes > SQS_BATCH_MAX_BYTES):
+                yield entries
+                entries, batch_bytes = [], 0
+            entries.append({'Id': str(index), 'MessageBody': text})
+            batch_bytes += body_bytes
+        if entries:
+            yield entries
+
     def send_to_dlq(self, message: SQSMessageWrapper, error_reason: str) -> bool:
         """
         Send message to Dead Letter Queue
@@ -181,7 +263,7 @@ class SQSClient:
             "original_message_id": message.message_id,
             "original_body": message.body.dict(),
             "error_reason": error_reason,
-            "failed_at": datetime.utcnow().isoformat(),
+            "failed_at": datetime.now(timezone.utc).isoformat(),
             "attempts": message.attempts
         }
         
@@ -288,7 +370,7 @@ class SQSClient:
             'input_queue': False,
             'output_queue': False,
             'dlq': False,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.now(timezone.utc).isoformat()
         }
         
         try:
@@ -47,6 +47,9 @@ def get_sqs_env_file_path() -> str:
     default_path = project_root / ".env"
     return str(default_path)
 
+# Resolved once at import; SQSSettings() instances reuse it instead of re-probing the filesystem
+SQS_ENV_FILE_PATH = get_sqs_env_file_path()
+
 class SQSSettings(BaseSettings):
     """SQS-specific configuration settings"""
     
@@ -87,7 +90,7 @@ class SQSSettings(BaseSettings):
     health_check_interval: int = Field(default=60, ge=10, description="Health check interval in seconds")
     
     model_config = ConfigDict(
-        env_file=get_sqs_env_file_path(),
+        env_file=SQS_ENV_FILE_PATH,
         env_prefix="SQS_",
         case_sensitive=False,
         extra="ignore"
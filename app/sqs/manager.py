@@ -7,7 +7,7 @@ import signal
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-from .config import SQSSettings
+from .config import SQSSettings, sqs_settings
 from .client import SQSClient
 from .processor import MessageProcessor
 
@@ -166,7 +166,7 @@ class SQSManager:
         
         # Count worker states
         total_workers = len(self.workers)
-        active_workers = sum(1 for w in self.workers if hasattr(w, 'is_running') and w.is_running)
+        active_workers = sum(1 for w in self.workers if getattr(w, 'is_running', False))
         failed_workers = total_workers - active_workers if self.is_running else 0
         
         # Return format expected by tests
@@ -201,7 +201,7 @@ class SQSManager:
             uptime_formatted = self._format_uptime(uptime_seconds)
         
         # Count workers  
-        running_workers = sum(1 for w in self.workers if hasattr(w, 'is_running') and w.is_running)
+        running_workers = sum(1 for w in self.workers if getattr(w, 'is_running', False))
         configured_workers = self.settings.worker_count
         
         return {
@@ -265,10 +265,18 @@ class SQSManager:
         Returns:
             Status information
         """
-        worker_stats = [worker.get_stats() for worker in self.workers]
-        
-        total_processed = sum(w['processed_count'] for w in worker_stats)
-        total_errors = sum(w['error_count'] for w in worker_stats)
+        # Single pass over the workers for stats, totals and the running count
+        worker_stats = []
+        total_processed = 0
+        total_errors = 0
+        active_workers = 0
+        for worker in self.workers:
+            stats = worker.get_stats()
+            worker_stats.append(stats)
+            total_processed += stats['processed_count']
+            total_errors += stats['error_count']
+            if getattr(worker, 'is_running', False):
+                active_workers += 1
         
         uptime = None
         if self.start_time:
@@ -279,7 +287,7 @@ class SQSManager:
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "uptime_seconds": uptime,
             "worker_count": len(self.workers),
-            "active_workers": sum(1 for w in self.workers if hasattr(w, 'is_running') and w.is_running),
+            "active_workers": active_workers,
             "total_processed": total_processed,
             "total_errors": total_errors,
             "success_rate": (
@@ -333,7 +341,7 @@ def get_sqs_manager() -> SQSManager:
     """Get the global SQS manager instance"""
     global _sqs_manager
     if _sqs_manager is None:
-        _sqs_manager = SQSManager()
+        _sqs_manager = SQSManager(sqs_settings)
     return _sqs_manager
 
 async def start_sqs_processing():
@@ -346,6 +354,28 @@ async def start_sqs_processing_blocking():
     manager = get_sqs_manager()
     await manager.start()
 
+# Handle of the task started by schedule_sqs_processing, kept so shutdown can cancel it
+_sqs_task: Optional[asyncio.Task] = None
+
+def schedule_sqs_processing() -> asyncio.Task:
+    """Start SQS processing as a tracked task on the running event loop"""
+    global _sqs_task
+    if _sqs_task is None or _sqs_task.done():
+        _sqs_task = asyncio.create_task(start_sqs_processing(), name="sqs-main")
+    return _sqs_task
+
+async def cancel_sqs_processing_task():
+    """Cancel the task started by schedule_sqs_processing if it is still running"""
+    global _sqs_task
+    task, _sqs_task = _sqs_task, None
+    if task and not task.done():
+        logger.info("🛑 Cancelling SQS task...")
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            logger.info("✅ SQS task cancelled")
+
 async def stop_sqs_processing():
     """Stop SQS processing (for use in FastAPI shutdown)"""
     global _sqs_manager
@@ -9,7 +9,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from ..api.routes import validate_data as api_validate_data
+from ..api.routes import process_validation_request as api_validate_data
 from ..models.validation import ValidationRequest
 from ..models.sqs_models import (
     SQSValidationRequest,
@@ -22,7 +22,8 @@ from ..models.sqs_models import (
     DataType,
     get_dataset_from_request,
     get_validation_rules_from_request,
-    create_response_from_request_and_results
+    create_response_from_request_and_results,
+    dump_response_payload
 )
 from .config import SQSSettings
 from .client import SQSClient
@@ -227,7 +228,7 @@ class MessageProcessor:
             # Always try to send to output queue if configured
             if self.settings.output_queue_url:
                 message_id = self.sqs_client.send_message(
-                    response.model_dump(),
+                    dump_response_payload(response),
                     queue_url=self.settings.get_output_queue_url()
                 )
                 
@@ -1,8 +1,45 @@
 from typing import List, Dict, Any
+from datetime import datetime
+import numpy as np
 import pandas as pd
 from app.models.rule import Rule
 
 
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_))
+
+
+def _is_float(value: Any) -> bool:
+    return isinstance(value, (float, np.floating))
+
+
+def _is_string(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _is_boolean(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_datetime(value: Any) -> bool:
+    # pd.Timestamp subclasses datetime; plain datetime.date values do not count
+    return isinstance(value, (datetime, np.datetime64))
+
+
+# Scalar type checks; plain isinstance tests instead of building a one-element
+# Series per value to ask pandas for its inferred dtype
+TYPE_CHECKERS = {
+    "INTEGER": _is_integer,
+    "FLOAT": _is_float,
+    "STRING": _is_string,
+    "VARCHAR": _is_string,
+    "TEXT": _is_string,
+    "BOOLEAN": _is_boolean,
+    "DATETIME": _is_datetime,
+    "DATE": _is_datetime,
+}
+
+
 def validate_column_values_to_be_of_type(data: List[Dict[str, Any]], rule: Rule) -> Dict[str, Any]:
     """
     Validate that all values in a column are of a specified type.
@@ -35,19 +72,7 @@ def validate_column_values_to_be_of_type(data: List[Dict[str, Any]], rule: Rule)
     
     expected_type = rule.value["type_"].upper()
     
-    # Type mapping for common types
-    type_checkers = {
-        "INTEGER": lambda x: pd.api.types.is_integer_dtype(pd.Series([x])),
-        "FLOAT": lambda x: pd.api.types.is_float_dtype(pd.Series([x])),
-        "STRING": lambda x: isinstance(x, str),
-        "VARCHAR": lambda x: isinstance(x, str),
-        "TEXT": lambda x: isinstance(x, str),
-        "BOOLEAN": lambda x: isinstance(x, bool),
-        "DATETIME": lambda x: pd.api.types.is_datetime64_any_dtype(pd.Series([x])),
-        "DATE": lambda x: pd.api.types.is_datetime64_any_dtype(pd.Series([x]))
-    }
-    
-    if expected_type not in type_checkers:
+    if expected_type not in TYPE_CHECKERS:
         return {
             "rule_name": rule.rule_name,
             "column_name": column_name,
@@ -58,15 +83,18 @@ def validate_column_values_to_be_of_type(data: List[Dict[str, Any]], rule: Rule)
     try:
         # Get non-null values
         non_null_values = df[column_name].dropna()
-        type_checker = type_checkers[expected_type]
-        unexpected_values = []
+        type_checker = TYPE_CHECKERS[expected_type]
         
-        for value in non_null_values:
-            try:
-                if not type_checker(value):
-                    unexpected_values.append(value)
-            except:
-                unexpected_values.append(value)
+        if non_null_values.empty:
+            unexpected_values = []
+        elif non_null_values.dtype != object:
+            # Homogeneous column: every element has the same Python type, so
+            # checking one element decides the whole column (iteration yields
+            # Python scalars, matching what the per-value path sees)
+            first_value = next(iter(non_null_values))
+            unexpected_values = [] if type_checker(first_value) else non_null_values.tolist()
+        else:
+            unexpected_values = [value for value in non_null_values.tolist() if not type_checker(value)]
         
         success = len(unexpected_values) == 0
         unexpected_count = len(unexpected_values)
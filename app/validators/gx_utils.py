@@ -96,7 +96,7 @@ def validate_with_gx(data: List[Dict[str, Any]], expectation_type: str, column:
     Generic function to validate data using Great Expectations
     
     Args:
-        data: List of dictionaries to validate
+        data: List of dictionaries, or an already built DataFrame, to validate
         expectation_type: name of the expectation method to call
         column: column name to validate
         **kwargs: arguments to pass to the expectation method
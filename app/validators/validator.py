@@ -16,7 +16,13 @@ def data_validator(request: ValidationRequest) -> ValidationResponse:
     rules = request.rules
     data = request.dataset
     
+    # Loop invariants, bound once
+    total_rules = len(rules)
+    n_rows = len(data)
+    n_cols = len(data[0]) if n_rows else 0
+    
     validation_results = []
+    results_append = validation_results.append
     successful_count = 0
     failed_count = 0
     
@@ -25,16 +31,17 @@ def data_validator(request: ValidationRequest) -> ValidationResponse:
         try:
             result = validate_rule(data, rule)
             
-            # Convert result to ValidationResultDetail model
-            validation_result = ValidationResultDetail(
+            # Convert result to ValidationResultDetail model; it is our own validator
+            # output, so skip re-validation and normalise loosely typed values
+            validation_result = ValidationResultDetail.model_construct(
                 rule_name=result.get("rule_name", rule.rule_name),
                 column_name=result.get("column_name", rule.column_name),
-                success=result.get("success", False),
-                message=result.get("message") or result.get("error") or "No message provided",
-                details=result.get("details", {})
+                success=bool(result.get("success", False)),
+                message=str(result.get("message") or result.get("error") or "No message provided"),
+                details=result.get("details") or {}
             )
             
-            validation_results.append(validation_result)
+            results_append(validation_result)
             
             if validation_result.success:
                 successful_count += 1
@@ -43,25 +50,25 @@ def data_validator(request: ValidationRequest) -> ValidationResponse:
                 
         except Exception as e:
             # Handle any unexpected errors during validation
-            error_result = ValidationResultDetail(
+            error_result = ValidationResultDetail.model_construct(
                 rule_name=rule.rule_name,
                 column_name=rule.column_name,
                 success=False,
                 message=f"Failed to validate rule: {str(e)}",
                 details={"error": str(e)}
             )
-            validation_results.append(error_result)
+            results_append(error_result)
             failed_count += 1
     
     # Create summary
-    summary = ValidationSummary(
-        total_rules=len(rules),
+    summary = ValidationSummary.model_construct(
+        total_rules=total_rules,
         successful_rules=successful_count,
         failed_rules=failed_count,
-        success_rate=successful_count / len(rules) if len(rules) > 0 else 0.0,
-        total_rows=len(data) if data else 0,
-        total_columns=len(data[0].keys()) if data else 0,
+        success_rate=successful_count / total_rules if total_rules > 0 else 0.0,
+        total_rows=n_rows,
+        total_columns=n_cols,
         execution_time_ms=0  # We could add timing later
     )
     
-    return ValidationResponse(results=validation_results, summary=summary)
+    return ValidationResponse.model_construct(results=validation_results, summary=summary)
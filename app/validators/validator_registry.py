@@ -1,4 +1,5 @@
 from typing import Dict, Callable, List, Any
+from functools import lru_cache
 from app.models.rule import Rule
 import importlib
 
@@ -51,12 +52,16 @@ VALIDATOR_MAPPING = {
     "expect_column_values_to_be_between_dates": ("app.validators.expect_column_values_to_be_between_dates", "validate_column_values_to_be_between_dates"),
 }
 
+@lru_cache(maxsize=None)
 def _get_validator_function(rule_name: str) -> Callable:
     """Lazy-load validator function by rule name"""
-    if rule_name not in VALIDATOR_MAPPING:
+    # Only module paths from the static whitelist are ever imported; rule names
+    # come straight from request bodies and must never reach the import system
+    target = VALIDATOR_MAPPING.get(rule_name)
+    if target is None:
         raise ValueError(f"Unknown validation rule: {rule_name}")
     
-    module_name, function_name = VALIDATOR_MAPPING[rule_name]
+    module_name, function_name = target
     try:
         module = importlib.import_module(module_name)
         return getattr(module, function_name)
@@ -115,13 +120,20 @@ LEGACY_RULE_MAPPING = {
     "ExpectColumnValuesToBeBetweenDates": "expect_column_values_to_be_between_dates",
 }
 
-# Cache for loaded validators to avoid repeated imports
-_validator_cache = {}
+# Every accepted rule name (snake_case and legacy) mapped to its canonical name,
+# built once so lookups don't need a separate normalization step
+_RULE_NAME_LOOKUP = {
+    **{rule_name: rule_name for rule_name in VALIDATOR_MAPPING},
+    **LEGACY_RULE_MAPPING,
+}
 
 def get_validator(rule_name: str) -> Callable[[List[Dict[str, Any]], Rule], Dict[str, Any]]:
     """
     Get the validator function for a given rule name with lazy loading.
     
+    Validator functions are resolved once per canonical rule name and memoized
+    by _get_validator_function, so repeated lookups skip the import machinery.
+    
     Args:
         rule_name: Name of the expectation rule
         
@@ -131,24 +143,12 @@ def get_validator(rule_name: str) -> Callable[[List[Dict[str, Any]], Rule], Dict
     Raises:
         ValueError: If no validator is found for the rule name
     """
-    # Check if already cached
-    if rule_name in _validator_cache:
-        return _validator_cache[rule_name]
-    
-    # Handle legacy rule names
-    normalized_rule_name = LEGACY_RULE_MAPPING.get(rule_name, rule_name)
-    
-    # Check cache again with normalized name
-    if normalized_rule_name in _validator_cache:
-        _validator_cache[rule_name] = _validator_cache[normalized_rule_name]  # Cache both names
-        return _validator_cache[rule_name]
+    normalized_rule_name = _RULE_NAME_LOOKUP.get(rule_name)
+    if normalized_rule_name is None:
+        raise ValueError(f"No validator found for rule: {rule_name}. Error: Unknown validation rule: {rule_name}")
     
-    # Load the validator function
     try:
-        validator_func = _get_validator_function(normalized_rule_name)
-        _validator_cache[rule_name] = validator_func
-        _validator_cache[normalized_rule_name] = validator_func
-        return validator_func
+        return _get_validator_function(normalized_rule_name)
     except (ImportError, AttributeError, ValueError) as e:
         raise ValueError(f"No validator found for rule: {rule_name}. Error: {e}")
 
@@ -161,8 +161,7 @@ def get_available_validators() -> List[str]:
         List of available rule names
     """
     # Return both legacy and new-style rule names
-    available = list(VALIDATOR_MAPPING.keys()) + list(LEGACY_RULE_MAPPING.keys())
-    return sorted(set(available))
+    return sorted(_RULE_NAME_LOOKUP)
 
 
 def validate_rule(data: List[Dict[str, Any]], rule: Rule) -> Dict[str, Any]:
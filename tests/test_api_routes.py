@@ -156,6 +156,29 @@ class TestValidationEndpoint:
         
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     
+    def test_validation_endpoint_body_errors_match_fastapi_shape(self):
+        """Test that body decoding errors keep FastAPI's own 422 detail shape"""
+        malformed = client.post(
+            "/api/rules/validate", content=b'{"dataset": [', headers={"Content-Type": "application/json"}
+        )
+        assert malformed.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert malformed.json()["detail"] == [{
+            "type": "json_invalid", "loc": ["body", 13], "msg": "JSON decode error",
+            "input": {}, "ctx": {"error": "Expecting value"}
+        }]
+
+        empty = client.post("/api/rules/validate", content=b"", headers={"Content-Type": "application/json"})
+        assert empty.json()["detail"] == [{"type": "missing", "loc": ["body"], "msg": "Field required", "input": None}]
+
+    def test_validation_endpoint_requires_json_content_type(self):
+        """Test that a valid JSON body sent as another media type is rejected"""
+        body = json.dumps({"dataset": [{"a": 1}], "rules": [{"rule_name": "expect_column_to_exist", "column_name": "a"}]})
+        response = client.post("/api/rules/validate", content=body, headers={"Content-Type": "text/plain"})
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["detail"][0]["type"] == "model_attributes_type"
+        assert response.json()["detail"][0]["loc"] == ["body"]
+
     def test_validation_endpoint_empty_request(self):
         """Test validation endpoint with empty request"""
         response = client.post("/api/rules/validate", json={})
@@ -254,8 +277,98 @@ class TestProcessValidationRequest:
         assert data["results"][0]["rule_name"] == "expect_column_to_exist"
         assert data["summary"]["successful_rules"] == 1
         assert data["summary"]["total_rules"] == 1
+
+    def test_process_validation_request_direct_call(self):
+        """Test the synchronous validation entry point shared with the SQS processor"""
+        from app.api.routes import process_validation_request
+        from app.models.validation import ValidationRequest as UnifiedValidationRequest
+
+        request = UnifiedValidationRequest(
+            rules=[{"rule_name": "expect_column_values_to_be_unique", "column_name": "test_col"}],
+            dataset=[{"test_col": "value1"}, {"test_col": "value2"}]
+        )
+
+        response = process_validation_request(request)
+
+        assert isinstance(response, ValidationResponse)
+        assert response.results[0].success is True
+        assert response.summary.total_rows == 2
+
+    def test_process_validation_request_keeps_rule_order(self):
+        """Test that each rule is validated in turn and results keep request order"""
+        from app.api.routes import process_validation_request
+        from app.models.validation import ValidationRequest as UnifiedValidationRequest
+
+        request = UnifiedValidationRequest(
+            rules=[
+                {"rule_name": "rule_a", "column_name": "col1"},
+                {"rule_name": "rule_b", "column_name": "col1"},
+                {"rule_name": "rule_a", "column_name": "col2"},
+            ],
+            dataset=[{"col1": 1, "col2": 2}]
+        )
+
+        with patch('app.api.routes.get_validator') as mock_get_validator:
+            mock_get_validator.return_value = lambda data, rule: {"success": rule.column_name == "col1"}
+            response = process_validation_request(request)
+
+        assert [call.args[0] for call in mock_get_validator.call_args_list] == ["rule_a", "rule_b", "rule_a"]
+        assert [(r.rule_name, r.column_name) for r in response.results] == [
+            ("rule_a", "col1"), ("rule_b", "col1"), ("rule_a", "col2")
+        ]
+        assert response.summary.successful_rules == 2
+        assert response.summary.failed_rules == 1
     
 
+class TestValidationJobEndpoints:
+    """Test asynchronous validation job endpoints"""
+
+    def test_submit_and_poll_validation_job(self):
+        """Test that a submitted job runs in the background and can be polled"""
+        response = client.post("/api/rules/validate/jobs", json={
+            "dataset": [{"col1": "a"}, {"col1": "b"}],
+            "rules": [{"rule_name": "expect_column_values_to_be_unique", "column_name": "col1"}]
+        })
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job = response.json()
+        assert job["status_url"] == f"/api/rules/validate/jobs/{job['job_id']}"
+
+        poll = client.get(job["status_url"])
+
+        assert poll.status_code == status.HTTP_200_OK
+        data = poll.json()
+        assert data["status"] == "success"
+        assert data["result"]["summary"]["successful_rules"] == 1
+        assert data["error"] is None
+
+    def test_submit_validation_job_requires_rules(self):
+        """Test that empty rules are rejected before a job is queued"""
+        response = client.post("/api/rules/validate/jobs", json={
+            "dataset": [{"col1": "a"}],
+            "rules": []
+        })
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_get_unknown_validation_job(self):
+        """Test polling a job id that does not exist"""
+        response = client.get("/api/rules/validate/jobs/does-not-exist")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_job_store_evicts_oldest_jobs(self):
+        """Test that the job store stays bounded"""
+        from app.core.jobs import JobStore
+
+        store = JobStore(max_jobs=2)
+        first = store.create()
+        store.create()
+        store.create()
+
+        assert store.get(first.job_id) is None
+
+
 class TestSQSEndpoint:
     """Test available API endpoints"""
 
@@ -863,6 +976,95 @@ class TestSQSRoutesDisabled:
         from app.api.routes import SQS_AVAILABLE
         assert SQS_AVAILABLE == False
 
+    def test_sqs_router_defines_management_routes(self):
+        """Test that the SQS handlers live on their own router, ready to be included"""
+        from app.api.sqs_routes import sqs_router
+
+        paths = {route.path for route in sqs_router.routes}
+        assert {"/sqs/status", "/sqs/health", "/sqs/start", "/sqs/stop", "/sqs/worker-stats"} <= paths
+
+    def test_sqs_router_uses_injected_manager(self):
+        """Test that SQS handlers receive the manager through dependency injection"""
+        from fastapi import FastAPI
+        from app.api import sqs_routes
+
+        mock_manager = MagicMock()
+        mock_manager.get_status.return_value = {
+            "worker_count": 2,
+            "active_workers": 1,
+            "total_processed": 5,
+            "total_errors": 1,
+            "success_rate": 0.8,
+            "workers": [{"worker_id": "w1", "is_running": True}, {"worker_id": "w2", "is_running": False}]
+        }
+
+        sqs_app = FastAPI()
+        sqs_app.include_router(sqs_routes.sqs_router)
+        sqs_app.dependency_overrides[sqs_routes._manager] = lambda: mock_manager
+        sqs_routes.get_worker_stats.cache_clear()
+
+        response = TestClient(sqs_app).get("/sqs/worker-stats")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["running_workers"] == 1
+        assert response.json()["total_workers"] == 2
+
+    def test_sqs_worker_stats_reuses_cached_status(self):
+        """Test that worker stats are derived from the cached status snapshot"""
+        from fastapi import FastAPI
+        from app.api import sqs_routes
+
+        mock_manager = MagicMock()
+        mock_manager.get_status.return_value = {"worker_count": 1, "active_workers": 1, "workers": [{"is_running": True}]}
+
+        sqs_app = FastAPI()
+        sqs_app.include_router(sqs_routes.sqs_router)
+        sqs_app.dependency_overrides[sqs_routes._manager] = lambda: mock_manager
+        sqs_routes.get_sqs_status.cache_clear()
+        sqs_routes.get_worker_stats.cache_clear()
+
+        sqs_client = TestClient(sqs_app)
+        assert sqs_client.get("/sqs/status").status_code == status.HTTP_200_OK
+        assert sqs_client.get("/sqs/worker-stats").json()["running_workers"] == 1
+
+        mock_manager.get_status.assert_called_once()
+
+    def test_sqs_route_errors_are_counted_and_sampled(self):
+        """Test that SQS client failures return 500 and are counted even when not logged"""
+        from fastapi import FastAPI
+        from botocore.exceptions import ClientError
+        from app.api import sqs_routes
+        from app.core.sampling import TokenBucket
+
+        mock_manager = MagicMock()
+        mock_manager.sqs_client.get_queue_stats.side_effect = ClientError(
+            {"Error": {"Code": "ServiceUnavailable", "Message": "down"}}, "GetQueueAttributes"
+        )
+
+        sqs_app = FastAPI()
+        sqs_app.include_router(sqs_routes.sqs_router)
+        sqs_app.dependency_overrides[sqs_routes._manager] = lambda: mock_manager
+        sqs_routes.get_queue_stats.cache_clear()
+        sqs_routes.sqs_route_errors.clear()
+
+        mock_manager.get_status.return_value = {"is_running": True}
+        sqs_routes.get_sqs_status.cache_clear()
+
+        with patch.object(sqs_routes, "_error_log_bucket", TokenBucket(rate=0, capacity=1)), \
+             patch.object(sqs_routes, "logger") as mock_logger:
+            sqs_client = TestClient(sqs_app)
+            for _ in range(3):
+                assert sqs_client.get("/sqs/queue-stats").status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+            # The counts are reported by /sqs/status
+            status_body = sqs_client.get("/sqs/status").json()
+
+        assert sqs_routes.sqs_route_errors["Failed to get queue stats"] == 3
+        mock_logger.error.assert_called_once()
+        assert status_body["is_running"] is True
+        assert status_body["route_errors"] == {"Failed to get queue stats": 3}
+        assert status_body["suppressed_error_logs"] == 2
+
     def test_sqs_status_not_available(self):
         """Test SQS status endpoint when SQS is not available"""
         # SQS routes should not be registered when SQS_AVAILABLE is False
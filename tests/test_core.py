@@ -116,6 +116,32 @@ class TestValidatorRegistry:
         except ImportError as e:
             pytest.skip(f"Validator registry not available: {e}")
 
+    def test_get_validator_is_memoized(self):
+        """Test that legacy and snake_case names resolve to the same cached function"""
+        try:
+            from app.validators.validator_registry import get_validator
+
+            validator = get_validator("expect_column_values_to_be_unique")
+
+            assert get_validator("expect_column_values_to_be_unique") is validator
+            assert get_validator("ExpectColumnValuesToBeUnique") is validator
+        except ImportError as e:
+            pytest.skip(f"Validator registry not available: {e}")
+
+    def test_get_validator_unknown_rule(self):
+        """Test that unknown rule names are rejected before any import"""
+        try:
+            from app.validators.validator_registry import get_validator
+
+            with patch("app.validators.validator_registry.importlib.import_module") as mock_import:
+                with pytest.raises(ValueError, match="No validator found for rule: not_a_rule"):
+                    get_validator("not_a_rule")
+                with pytest.raises(ValueError, match="No validator found for rule: os"):
+                    get_validator("os")
+            mock_import.assert_not_called()
+        except ImportError as e:
+            pytest.skip(f"Validator registry not available: {e}")
+
 
 class TestAPIRoutes:
     """Test API route functionality"""
@@ -236,6 +262,53 @@ class TestUtilityFunctions:
             pytest.skip(f"GX utils not available: {e}")
 
 
+    @pytest.mark.asyncio
+    async def test_ttl_cache_reuses_result_until_cleared(self):
+        """Test that ttl_cache serves cached results and honours cache_clear"""
+        from app.core.cache import ttl_cache
+
+        calls = []
+
+        @ttl_cache(60)
+        async def fetch_status(name):
+            calls.append(name)
+            return {"name": name, "call": len(calls)}
+
+        first = await fetch_status("workers")
+        assert await fetch_status("workers") is first
+        assert (await fetch_status("queues"))["call"] == 2
+
+        fetch_status.cache_clear()
+        assert (await fetch_status("workers"))["call"] == 3
+
+    @pytest.mark.asyncio
+    async def test_ttl_cache_expires_entries(self):
+        """Test that ttl_cache re-runs the function once the TTL has passed"""
+        from app.core.cache import ttl_cache
+
+        calls = []
+
+        @ttl_cache(0)
+        async def fetch_status():
+            calls.append(1)
+            return len(calls)
+
+        assert await fetch_status() == 1
+        assert await fetch_status() == 2
+
+    def test_token_bucket_allows_burst_then_drops(self):
+        """Test that TokenBucket admits its capacity, then refills at its rate"""
+        from app.core.sampling import TokenBucket
+
+        with patch("app.core.sampling.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(rate=2.0, capacity=3)
+            assert [bucket.consume() for _ in range(5)] == [True, True, True, False, False]
+        assert bucket.dropped == 2
+
+        with patch("app.core.sampling.time.monotonic", return_value=101.0):
+            assert [bucket.consume() for _ in range(3)] == [True, True, False]
+
+
 class TestMainApplication:
     """Test main application functionality"""
     
@@ -207,7 +207,15 @@ class TestSettings:
         with patch.dict(os.environ, {'PORT': '70000'}):
             settings = Settings()
             assert settings.port == 70000  # Currently no validation prevents this
-    
+
+    def test_settings_workers(self):
+        """Test that the uvicorn worker count defaults to one and is read from WORKERS"""
+        with patch.dict(os.environ, {}, clear=True):
+            assert Settings().workers == 1
+
+        with patch.dict(os.environ, {'WORKERS': '3'}):
+            assert Settings().workers == 3
+
     def test_settings_allowed_origins_validation(self):
         """Test allowed_origins validation and parsing"""
         # Test valid JSON list
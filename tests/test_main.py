@@ -30,7 +30,23 @@ class TestMainAppComprehensive:
         middleware_classes = [middleware.cls.__name__ if hasattr(middleware, 'cls') else str(type(middleware)) for middleware in app.user_middleware]
         has_cors = any('CORS' in name for name in middleware_classes)
         assert has_cors or len(middleware_classes) > 0  # Either CORS or other middleware
-    
+
+    def test_app_access_log_middleware(self, caplog):
+        """Test that requests are logged with their response status"""
+        import logging
+
+        assert any(m.cls.__name__ == "AccessLogMiddleware" for m in app.user_middleware)
+
+        client = TestClient(app)
+        with caplog.at_level(logging.INFO, logger="app.core.middleware"):
+            response = client.get("/health?probe=1", headers={"Origin": "http://localhost:3000"})
+
+        assert response.status_code == 200
+        messages = [record.getMessage() for record in caplog.records]
+        assert "🔍 GET /health?probe=1" in messages
+        assert "🌐 Origin: http://localhost:3000" in messages
+        assert any(m.startswith("✅ GET /health?probe=1 - 200 - ") for m in messages)
+
     def test_app_routes_registration(self):
         """Test route registration"""
         routes = [route.path for route in app.routes if hasattr(route, 'path')]
@@ -85,7 +101,17 @@ class TestMainAppComprehensive:
         
         # Should not error (may be 405 but shouldn't crash)
         assert response.status_code in [200, 405]
-    
+
+    def test_app_cors_wildcard_collapses_origins(self):
+        """Test that a wildcard in allowed_origins is served as a plain "*" """
+        assert "*" in settings.allowed_origins
+        client = TestClient(app)
+
+        response = client.get("/health", headers={"Origin": "https://unlisted.example.com"})
+
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert "access-control-allow-credentials" not in response.headers
+
     def test_app_health_endpoint_detailed(self):
         """Test health endpoint functionality"""
         client = TestClient(app)
@@ -197,6 +223,11 @@ class TestConfigurationComprehensive:
         # Should be consistent
         assert settings1.allowed_origins == settings2.allowed_origins
 
+        # Settings are frozen once loaded
+        from pydantic import ValidationError
+        with pytest.raises(ValidationError):
+            settings.port = 9999
+
 
 class TestAPIRoutesComprehensive:
     """Comprehensive tests for API routes functionality"""
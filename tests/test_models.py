@@ -537,7 +537,54 @@ class TestBackupModels:
         except Exception:
             # Coverage is the goal
             pass
-    
+
+    def test_validation_backup_legacy_field_sync(self):
+        """Test that legacy and current field names fill each other in"""
+        from app.models.validation_backup import ValidationRule, ValidationResultDetail, ValidationSummary
+
+        rule = ValidationRule(expectation_type="expect_column_to_exist", kwargs={"column": "a"})
+        assert rule.rule_name == "expect_column_to_exist"
+        assert rule.value == {"column": "a"}
+
+        result = ValidationResultDetail(rule="expect_column_to_exist", column="a", success=True, message="ok")
+        assert (result.rule_name, result.column_name) == ("expect_column_to_exist", "a")
+
+        summary = ValidationSummary(total_rules=1, successful_rules=0, failed_rules=1, success_rate=0.0)
+        assert (summary.passed, summary.failed) == (0, 1)
+
+    def test_validation_backup_convert_legacy_rules(self):
+        """Test legacy rule conversion for each supported format"""
+        from app.models.validation_backup import ValidationRule, convert_legacy_validation_request
+
+        existing = ValidationRule(rule_name="expect_column_to_exist", column_name="c")
+        request = convert_legacy_validation_request({
+            "dataset": [{"a": 1}],
+            "rules": [
+                {"expectation_type": "expect_column_to_exist", "kwargs": {"column": "a"}},
+                {"rule_name": "expect_column_values_to_not_be_null", "column_name": "b"},
+                {"column_name": "x", "value": {"min_value": 1}},
+                existing,
+            ],
+        })
+        assert [r.rule_name for r in request.rules] == [
+            "expect_column_to_exist", "expect_column_values_to_not_be_null", "unknown", "expect_column_to_exist"
+        ]
+        assert request.rules[0].column_name == "a"
+        assert request.rules[1].expectation_type == "expect_column_values_to_not_be_null"
+        assert request.rules[3] is existing
+
+    def test_validation_backup_request_rules_fallback(self):
+        """Test that validation_rules falls back to legacy rules and must not be empty"""
+        import pydantic
+        from app.models.validation_backup import SQSValidationRequest
+
+        rule = {"rule_name": "expect_column_to_exist", "column_name": "id"}
+        request = SQSValidationRequest(message_id="m", data=[{"id": 1}], rules=[rule])
+        assert [r.rule_name for r in request.validation_rules] == ["expect_column_to_exist"]
+
+        with pytest.raises(pydantic.ValidationError):
+            SQSValidationRequest(message_id="m", data=[{"id": 1}], validation_rules=[])
+
     def test_validation_simple_import(self):
         """Test importing validation simple model"""
         try:
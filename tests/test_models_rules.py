@@ -304,7 +304,24 @@ class TestValidationModelsComprehensive:
         # Should have reasonable defaults
         assert rule.rule_name == "expect_column_to_exist"
         assert rule.column_name == "test_column"
-    
+
+    def test_validation_rule_is_slotted_and_frozen(self):
+        """Test that validation rules are read-only slotted records"""
+        from dataclasses import FrozenInstanceError
+        from app.models.validation import ValidationRequest, RuleSeverity
+
+        request = ValidationRequest(
+            dataset=[{"a": 1}],
+            rules=[{"rule_name": "expect_column_to_exist", "column_name": "a", "severity": "warning"}]
+        )
+        rule = request.rules[0]
+
+        assert isinstance(rule, ValidationRule)
+        assert rule.severity is RuleSeverity.WARNING
+        assert not hasattr(rule, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            rule.column_name = "b"
+
     def test_data_type_enum(self):
         """Test DataType enum"""
         assert DataType.TABULAR == "tabular"
@@ -317,6 +334,14 @@ class TestValidationModelsComprehensive:
         assert MessageStatus.SUCCESS == "success"
         assert MessageStatus.FAILED == "failed"
 
+    def test_enums_shared_across_model_modules(self):
+        """Test that validation and SQS models use the same enum classes"""
+        from app.models import enums, sqs_models
+
+        assert DataType is enums.DataType is sqs_models.DataType
+        assert MessageStatus is enums.MessageStatus is sqs_models.MessageStatus
+        assert isinstance(sqs_models.DataType.TABULAR, DataType)
+
 
 class TestSQSModelsComprehensive:
     """Comprehensive tests for SQS models"""
@@ -341,7 +366,203 @@ class TestSQSModelsComprehensive:
         assert request.data_entry.file_id == "test-file-123"
         assert request.data_entry.policy_id == "test-policy-456"
         assert len(request.data_entry.validation_rules) == 1
-    
+
+    def test_sqs_validation_rule_is_frozen_and_fills_defaults(self):
+        """Test that SQS rules are immutable, ignore unknown keys and derive defaults"""
+        from dataclasses import FrozenInstanceError
+        from app.models.sqs_models import ValidationRule
+
+        rule = ValidationRule(
+            rule_name="expect_column_values_to_be_between",
+            column_name="age",
+            value={"min_value": 0, "max_value": 120},
+            unknown_field="ignored"
+        )
+
+        assert rule.expectation_type == "expect_column_values_to_be_between"
+        assert rule.kwargs == {"min_value": 0, "max_value": 120}
+        assert not hasattr(rule, "unknown_field")
+        assert not hasattr(rule, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            rule.severity = "warning"
+
+    def test_sqs_adapters_round_trip_bytes(self):
+        """Test parsing request bytes and dumping response bytes via the cached adapters"""
+        import json
+        from app.models.sqs_models import parse_request_bytes, dump_response_bytes
+
+        body = json.dumps({
+            "data_entry": {
+                "data_type": "tabular",
+                "domain_name": "test_domain",
+                "file_id": "file-1",
+                "policy_id": "policy-1",
+                "data": {"id": "1", "name": "John"},
+                "validation_rules": [{"rule_name": "expect_column_to_exist", "column_name": "name"}]
+            }
+        }).encode()
+
+        request = parse_request_bytes(body)
+        assert isinstance(request, SQSValidationRequest)
+        assert request.data_entry.validation_rules[0].column_name == "name"
+
+        response = SQSValidationResponse(
+            file_id="file-1", policy_id="policy-1", data_type="tabular",
+            status="success", domain_name="test_domain", data={"id": "1"}
+        )
+        assert json.loads(dump_response_bytes(response)) == response.model_dump()
+
+    def test_sqs_model_schemas_built_at_import(self):
+        """Test that no SQS model defers its schema build to the first message"""
+        from app.models import sqs_models
+
+        for model in (
+            sqs_models.ValidationRule, sqs_models.DataEntry, sqs_models.SQSValidationRequest,
+            sqs_models.LegacySQSValidationRequest,
+            sqs_models.ValidationResultDetail, sqs_models.ValidationSummary,
+            sqs_models.SQSValidationResponse, sqs_models.SQSMessageWrapper, sqs_models.ProcessingResult
+        ):
+            assert model.__pydantic_complete__, model.__name__
+
+    def test_sqs_parsed_rule_names_are_shared_strings(self):
+        """Test that repeated rule and column names from JSON bodies are the same str object"""
+        import json
+        from app.models.sqs_models import parse_request_bytes
+
+        body = json.dumps({"data_entry": {
+            "data_type": "tabular", "domain_name": "d", "file_id": "f", "policy_id": "p",
+            "data": {"id": "1"},
+            "validation_rules": [{"rule_name": "expect_column_to_exist", "column_name": "id"}]
+        }})
+
+        first = parse_request_bytes(body).data_entry.validation_rules[0]
+        second = parse_request_bytes(body).data_entry.validation_rules[0]
+
+        assert first.rule_name is second.rule_name
+        assert first.column_name is second.column_name
+
+    def test_sqs_legacy_bodies_use_separate_model(self):
+        """Test that only bodies without a data_entry go through the legacy conversion"""
+        import json
+        from pydantic import ValidationError
+        from app.models.sqs_models import parse_request_bytes, LegacySQSValidationRequest
+
+        legacy = {
+            "message_id": "legacy-msg",
+            "data": [{"name": "John"}],
+            "rules": [{"rule_name": "expect_column_to_exist", "column_name": "name"}]
+        }
+
+        request = parse_request_bytes(json.dumps(legacy))
+        assert isinstance(request, LegacySQSValidationRequest)
+        assert request.data_entry.file_id == "legacy-msg"
+
+        with pytest.raises(ValidationError):
+            SQSValidationRequest.model_validate(legacy)
+
+        # The data_entry marker inside a value does not make a body current-format
+        legacy["data"] = [{"name": "John", "note": '"data_entry"'}]
+        request = parse_request_bytes(json.dumps(legacy).encode())
+        assert request.data_entry.data["records"][0]["note"] == '"data_entry"'
+
+    def test_sqs_timestamps_use_epoch_ms_on_the_wire(self):
+        """Test that timestamps dump as epoch milliseconds in JSON and stay datetimes in Python"""
+        import json
+        from datetime import datetime, timezone
+        from app.models.sqs_models import SQSMessageWrapper
+
+        received = datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+        wrapper = SQSMessageWrapper(
+            receipt_handle="handle", message_id="msg-1", received_at=received,
+            body={"data_entry": {
+                "data_type": "tabular", "domain_name": "d", "file_id": "f", "policy_id": "p",
+                "data": {"id": "1"}, "validation_rules": [{"rule_name": "expect_column_to_exist"}]
+            }}
+        )
+
+        wire = json.loads(wrapper.model_dump_json())
+        assert wire["received_at"] == 1704164645678
+        assert wrapper.model_dump()["received_at"] == received
+        assert SQSMessageWrapper.model_validate_json(wrapper.model_dump_json()).received_at == received
+
+    def test_sqs_response_payload_trims_success_only(self):
+        """Test that success payloads drop null fields while failures keep everything"""
+        import json
+        from app.models.sqs_models import dump_response_payload, dump_success_bytes
+
+        common = dict(file_id="file-1", policy_id="policy-1", data_type="tabular",
+                      domain_name="test_domain", data={"id": "1"})
+        success = SQSValidationResponse(status="success", **common)
+        failure = SQSValidationResponse(status="fail", failed_validations=[
+            {"rule_name": "expect_column_to_exist", "column_name": "name", "error_message": "Missing"}
+        ], **common)
+
+        assert "failed_validations" not in dump_response_payload(success)
+        assert "failed_validations" not in json.loads(dump_success_bytes(success))
+        assert dump_response_payload(failure)["failed_validations"][0]["status"] == "fail"
+
+    def test_sqs_response_rejects_unknown_status_and_data_type(self):
+        """Test that outbound status and data_type are limited to known values"""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError) as exc_info:
+            SQSValidationResponse(
+                file_id="file-1", policy_id="policy-1", data_type="xml",
+                status="failed", domain_name="test_domain", data={"id": "1"}
+            )
+
+        assert {error["loc"][0] for error in exc_info.value.errors()} == {"data_type", "status"}
+
+        # The trusted builder checks the same values without full validation
+        common = dict(file_id="file-1", policy_id="policy-1", domain_name="test_domain", data={"id": "1"})
+        with pytest.raises(ValueError, match="status"):
+            SQSValidationResponse.build_trusted(data_type="tabular", status="bogus", **common)
+        with pytest.raises(ValueError, match="data_type"):
+            SQSValidationResponse.build_trusted(data_type="ok", status="success", **common)
+
+        from typing import get_args
+        from app.models.enums import DataType
+        from app.models.sqs_models import DataTypeT
+        assert set(get_args(DataTypeT)) == {member.value for member in DataType}
+
+    def test_sqs_outbound_models_reject_unknown_fields(self):
+        """Test that outbound models fail loudly on misspelled keyword arguments"""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            FailedValidation(rule_name="r", column_name="c", error_message="e", eror_code="X")
+
+        with pytest.raises(ValidationError):
+            SQSValidationResponse(
+                file_id="file-1", policy_id="policy-1", data_type="tabular",
+                status="success", domain_name="test_domain", data={"id": "1"}, total_rules=1
+            )
+
+        # The trusted builder skips validation but still rejects misspelled fields
+        with pytest.raises(TypeError, match="failed_validaitons"):
+            SQSValidationResponse.build_trusted(
+                file_id="file-1", policy_id="policy-1", data_type="tabular",
+                status="fail", domain_name="test_domain", data={"id": "1"}, failed_validaitons=[]
+            )
+
+    def test_sqs_data_entry_rejects_empty_data_and_rules(self):
+        """Test that empty data and rule lists fail schema validation"""
+        from pydantic import ValidationError
+        from app.models.sqs_models import DataEntry, DataType
+
+        with pytest.raises(ValidationError) as exc_info:
+            DataEntry(
+                data_type=DataType.TABULAR,
+                domain_name="test_domain",
+                file_id="test-file-123",
+                policy_id="test-policy-456",
+                data={},
+                validation_rules=[]
+            )
+
+        errors = {error["loc"][0]: error["type"] for error in exc_info.value.errors()}
+        assert errors == {"data": "too_short", "validation_rules": "too_short"}
+
     def test_failed_validation_creation(self):
         """Test failed validation model creation"""
         failed = FailedValidation(
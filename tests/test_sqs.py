@@ -277,6 +277,34 @@ class TestSQSModelMethods:
         assert response.status == "success"
         assert response.domain_name == "test_domain"
 
+    def test_create_response_trusted_build_matches_validated(self):
+        """Test the unvalidated response build produces the same payload as a validated one"""
+        request = SQSValidationRequest(
+            data_entry=DataEntry(
+                data_type=DataType.TABULAR,
+                domain_name="test_domain",
+                file_id="test-file-123",
+                policy_id="test-policy-456",
+                data={"id": "row-1"},
+                validation_rules=[ValidationRule(rule_name="expect_column_to_exist", column_name="a")]
+            )
+        )
+        results = [
+            ValidationResultDetail(rule_name="expect_column_to_exist", column_name="a", success=False, message="Missing")
+        ]
+        summary = ValidationSummary(
+            total_rules=1, successful_rules=0, failed_rules=1, success_rate=0.0,
+            total_rows=1, total_columns=1, execution_time_ms=5
+        )
+
+        response = create_response_from_request_and_results(request, results, summary, 5)
+
+        assert response.status == "fail"
+        assert isinstance(response.failed_validations[0], FailedValidation)
+        assert response.data == {"id": "row-1"}
+        assert request.data_entry.id_payload is request.data_entry.id_payload
+        assert response.model_dump() == SQSValidationResponse.model_validate(response.model_dump()).model_dump()
+
 
 class TestSQSClient:
     """Tests for SQS Client"""
@@ -4,6 +4,7 @@ Tests SQS client functionality for AWS SQS operations
 """
 import pytest
 import json
+import asyncio
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 from botocore.exceptions import ClientError, BotoCoreError
@@ -39,6 +40,20 @@ class TestSQSClientInitialization:
             region_name=settings.aws_region
         )
 
+    @patch('app.sqs.client.boto3.Session')
+    def test_sqs_client_init_uses_pooled_config(self, mock_session):
+        """Test that the boto3 client is built with the shared connection config"""
+        settings = SQSSettings()
+        settings.worker_count = 6
+
+        SQSClient(settings)
+
+        config = mock_session.return_value.client.call_args[1]['config']
+        assert config.max_pool_connections == 16
+        assert config.tcp_keepalive is True
+        assert config.retries == {"mode": "adaptive", "max_attempts": 5}
+        assert config.read_timeout > 20
+
     @patch('app.sqs.client.boto3.Session')
     def test_sqs_client_init_failure(self, mock_session):
         """Test SQS client initialization failure"""
@@ -127,6 +142,49 @@ class TestSQSClientReceiveMessages:
         assert messages[0].receipt_handle == 'receipt-123'
         assert messages[0].body.data_entry.file_id == "file-123"
 
+    def test_receive_messages_legacy_format(self):
+        """Test that legacy message bodies are converted when parsed from JSON"""
+        legacy_body = {
+            "message_id": "legacy-msg",
+            "correlation_id": "legacy-corr",
+            "data": [{"col1": "value1"}],
+            "rules": [{"rule_name": "expect_column_to_exist", "column_name": "col1"}]
+        }
+        self.client.sqs.receive_message.return_value = {
+            'Messages': [
+                {
+                    'MessageId': 'msg-legacy',
+                    'ReceiptHandle': 'receipt-legacy',
+                    'Body': json.dumps(legacy_body),
+                    'Attributes': {}
+                }
+            ]
+        }
+
+        messages = self.client.receive_messages()
+
+        assert len(messages) == 1
+        assert messages[0].body.data_entry.file_id == "legacy-msg"
+        assert messages[0].body.data_entry.validation_rules[0].rule_name == "expect_column_to_exist"
+
+    def test_receive_messages_share_batch_timestamp(self):
+        """Test that all messages from one receive call carry the same received_at"""
+        legacy_body = json.dumps({
+            "data": [{"col1": "value1"}],
+            "rules": [{"rule_name": "expect_column_to_exist", "column_name": "col1"}]
+        })
+        self.client.sqs.receive_message.return_value = {
+            'Messages': [
+                {'MessageId': f'msg-{i}', 'ReceiptHandle': f'receipt-{i}', 'Body': legacy_body}
+                for i in range(3)
+            ]
+        }
+
+        messages = self.client.receive_messages()
+
+        assert len(messages) == 3
+        assert len({m.received_at for m in messages}) == 1
+
     def test_receive_messages_no_messages(self):
         """Test receiving when no messages available"""
         self.client.sqs.receive_message.return_value = {}
@@ -266,6 +324,81 @@ class TestSQSClientSendMessage:
             MessageBody=json.dumps(message_body, default=str)
         )
 
+    def test_send_message_pre_serialized_body(self):
+        """Test that a JSON string body is forwarded without re-encoding"""
+        self.client.sqs.send_message.return_value = {'MessageId': 'msg-123'}
+        message_body = '{"test": "data"}'
+        
+        result = self.client.send_message(message_body)
+        
+        assert result == 'msg-123'
+        call_args = self.client.sqs.send_message.call_args[1]
+        assert call_args['MessageBody'] is message_body
+
+    def test_send_message_batch_chunks_and_maps_ids(self):
+        """Test that batch sends are split at the SQS limit and IDs keep input order"""
+        def fake_batch(QueueUrl, Entries):
+            successful = [{'Id': e['Id'], 'MessageId': f"msg-{e['Id']}"} for e in Entries if e['Id'] != '3']
+            failed = [{'Id': '3', 'Code': 'InvalidMessageContents', 'Message': 'bad'}] if any(e['Id'] == '3' for e in Entries) else []
+            return {'Successful': successful, 'Failed': failed}
+
+        self.client.sqs.send_message_batch.side_effect = fake_batch
+        bodies = [{"n": i} for i in range(12)]
+
+        result = self.client.send_message_batch(bodies, queue_url="https://sqs.test/queue")
+
+        assert self.client.sqs.send_message_batch.call_count == 2
+        first_call = self.client.sqs.send_message_batch.call_args_list[0][1]
+        assert len(first_call['Entries']) == 10
+        assert first_call['QueueUrl'] == "https://sqs.test/queue"
+        assert result[0] == 'msg-0'
+        assert result[3] is None
+        assert result[11] == 'msg-11'
+
+    def test_send_message_batch_splits_on_payload_size(self):
+        """Test that batches stay under the SQS payload limit and oversized bodies fail alone"""
+        from app.sqs.client import SQS_BATCH_MAX_BYTES
+
+        self.client.sqs.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            'Successful': [{'Id': e['Id'], 'MessageId': f"msg-{e['Id']}"} for e in Entries]
+        }
+        # Five 100 KiB bodies fit two per call; the 300 KiB one is over the limit by itself
+        bodies = ["x" * 100 * 1024] * 3 + ["y" * 300 * 1024] + ["z" * 100 * 1024] * 2
+
+        result = self.client.send_message_batch(bodies)
+
+        calls = self.client.sqs.send_message_batch.call_args_list
+        sizes = [sum(len(e['MessageBody']) for e in call[1]['Entries']) for call in calls]
+        assert all(size <= SQS_BATCH_MAX_BYTES for size in sizes)
+        assert [[e['Id'] for e in call[1]['Entries']] for call in calls] == [['0', '1'], ['2', '4'], ['5']]
+        assert result == ['msg-0', 'msg-1', 'msg-2', None, 'msg-4', 'msg-5']
+
+    def test_send_message_batch_client_error(self):
+        """Test that a failed batch call yields None for its messages"""
+        self.client.sqs.send_message_batch.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDenied', 'Message': 'Access denied'}},
+            'SendMessageBatch'
+        )
+
+        result = self.client.send_message_batch(['{"a": 1}', '{"b": 2}'])
+
+        assert result == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_message_batcher_coalesces_concurrent_sends(self):
+        """Test that concurrent sends share a single SendMessageBatch call"""
+        from app.sqs.batcher import MessageBatcher
+
+        self.client.sqs.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            'Successful': [{'Id': e['Id'], 'MessageId': f"msg-{e['Id']}"} for e in Entries]
+        }
+        batcher = MessageBatcher(self.client, queue_url="https://sqs.test/queue", max_wait_seconds=0.05)
+
+        results = await asyncio.gather(*(batcher.send({"n": i}) for i in range(3)))
+
+        assert results == ['msg-0', 'msg-1', 'msg-2']
+        assert self.client.sqs.send_message_batch.call_count == 1
+
     def test_send_message_with_delay(self):
         """Test sending message with delay"""
         self.client.sqs.send_message.return_value = {'MessageId': 'msg-123'}
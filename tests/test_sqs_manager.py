@@ -165,7 +165,24 @@ class TestSQSManagerWorkerManagement:
             assert self.manager.stop_time is not None
             assert len(self.manager.workers) == 0
     
-    @pytest.mark.asyncio 
+    @pytest.mark.asyncio
+    async def test_running_flag_does_not_query_sqs(self):
+        """Test that start/stop only flip the local is_running flag"""
+        with patch('app.sqs.manager.MessageProcessor') as mock_processor_class:
+            mock_processor = MagicMock()
+            mock_processor.run_worker_loop = AsyncMock(side_effect=lambda: asyncio.sleep(10))
+            mock_processor_class.return_value = mock_processor
+
+            await self.manager.start_workers()
+            assert self.manager.is_running is True
+
+            await self.manager.stop()
+            assert self.manager.is_running is False
+
+        # Queue state is only checked by the health endpoints
+        assert self.manager.sqs_client.mock_calls == []
+
+    @pytest.mark.asyncio
     async def test_stop_workers_when_not_running(self):
         """Test stopping workers when not running"""
         # Should not raise exception
@@ -815,5 +832,39 @@ class TestSQSManagerIntegration:
                 pass
 
 
+
+class TestSQSProcessingTask:
+    """Test the tracked background task helpers"""
+
+    @pytest.mark.asyncio
+    async def test_schedule_and_cancel_sqs_processing(self):
+        """Test that scheduling is idempotent and the task can be cancelled"""
+        from app.sqs import manager as manager_module
+
+        started = asyncio.Event()
+
+        async def fake_start():
+            started.set()
+            await asyncio.sleep(3600)
+
+        with patch('app.sqs.manager.start_sqs_processing', fake_start):
+            task = manager_module.schedule_sqs_processing()
+            assert manager_module.schedule_sqs_processing() is task
+
+            await started.wait()
+            await manager_module.cancel_sqs_processing_task()
+
+        assert task.cancelled()
+        assert manager_module._sqs_task is None
+
+    @pytest.mark.asyncio
+    async def test_cancel_without_scheduled_task(self):
+        """Test that cancelling with no task scheduled is a no-op"""
+        from app.sqs import manager as manager_module
+
+        await manager_module.cancel_sqs_processing_task()
+
+        assert manager_module._sqs_task is None
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])